@@ -497,7 +497,7 @@ class MockUpbitAPI:
                 market=market,
                 price=float(row['close']),
                 volume=float(row['volume']),
-                timestamp=row['timestamp'],
+                timestamp=row['timestamp'].timestamp(),
                 high=float(row['high']),
                 low=float(row['low']),
                 open=float(row['open']),
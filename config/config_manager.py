@@ -183,9 +183,17 @@ class ConfigManager:
         """설정 변경 시 실행할 콜백 함수 등록"""
         self.callbacks.append(callback_func)
 
+    def unregister_callback(self, callback_func):
+        """등록한 콜백 해제 (콜백을 가진 객체가 수거될 수 있도록 사용 종료 시 호출)"""
+        try:
+            self.callbacks.remove(callback_func)
+        except ValueError:
+            pass
+
     def _notify_callbacks(self, key_path: str, new_value: Any, old_value: Any):
         """설정 변경 콜백 실행"""
-        for callback in self.callbacks:
+        # 콜백 실행 중 다른 스레드가 등록/해제해도 안전하도록 복사본을 순회
+        for callback in tuple(self.callbacks):
             try:
                 callback(key_path, new_value, old_value)
             except Exception as e:
@@ -4,7 +4,7 @@
 """
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 import numpy as np
 
 
@@ -20,6 +20,7 @@ class AdvancedRiskManager:
     def __init__(self, config_manager):
         self.config = config_manager
         self.active_positions: Dict[str, Dict] = {}
+        self.realized_pnl = 0.0
 
     def check_loss_limits(self) -> Dict[str, object]:
         daily_limit = self.config.get_config('risk_management.loss_limits.daily_loss_limit') or self.config.get_config('trading.daily_loss_limit') or 50000
@@ -32,17 +33,19 @@ class AdvancedRiskManager:
     def check_position_correlation(self, symbol: str, direction: str) -> Dict[str, object]:
         return {"allowed": True, "reason": "ok"}
 
-    def get_risk_metrics(self, df, entry_price: float, direction: str, signal_strength: float, account_balance: float) -> RiskMetrics:
+    def get_risk_metrics(self, df: Optional[object], entry_price: float, direction: str, signal_strength: float, account_balance: float) -> RiskMetrics:
         """ATR 기반 SL/TP, Kelly 캡, VaR 캡을 반영한 리스크 메트릭 산출
-        df: pandas.DataFrame with columns [high, low, close]
+        df: pandas.DataFrame with columns [high, low, close] (None이거나 3개 미만이면 ATR을 진입가의 1%로 근사)
         """
         # 1) ATR 추정 (단순 근사: 최근 N=14 구간의 (high-low) 평균)
-        try:
-            atr_window = int(self.config.get_config('risk_management.atr_stop_loss.atr_period') or 14)
-            recent = df.tail(atr_window)
-            atr = float(np.mean(recent['high'] - recent['low'])) if len(recent) >= 3 else entry_price * 0.01
-        except Exception:
-            atr = entry_price * 0.01
+        atr = entry_price * 0.01
+        if df is not None and len(df) >= 3:
+            try:
+                atr_window = int(self.config.get_config('risk_management.atr_stop_loss.atr_period') or 14)
+                recent = df.tail(atr_window)
+                atr = float(np.mean(recent['high'] - recent['low']))
+            except Exception:
+                pass
         atr_mult = float(self.config.get_config('risk_management.atr_stop_loss.atr_multiplier') or 1.5)
 
         # 2) Kelly fraction (보수적 캡)
@@ -71,9 +74,33 @@ class AdvancedRiskManager:
 
         return RiskMetrics(position_size=position_size, kelly_fraction=kelly, stop_loss=sl, risk_reward_ratio=rr)
 
-    def add_position(self, position_id: str, symbol: str, direction: str, size: float):
-        self.active_positions[position_id] = {"symbol": symbol, "direction": direction, "size": size}
+    def add_position(self, position_id: str, symbol: str, direction: str, size: float, entry_price: float = 0.0):
+        self.active_positions[position_id] = {"symbol": symbol, "direction": direction, "size": size, "entry_price": entry_price}
 
     def update_position(self, position_id: str, pnl: float):
         # 최소 구현
         pass
+
+    def close_all_at(self, price: float) -> np.ndarray:
+        """전체 포지션을 price에 청산 처리하고 포지션별 실현 손익(원) 배열 반환
+        size는 진입 금액(원) 기준이며, 진입가를 모르는 포지션의 손익은 0으로 둔다.
+        """
+        positions = list(self.active_positions.values())
+        count = len(positions)
+        if count == 0:
+            return np.empty(0)
+
+        sizes = np.fromiter((p["size"] for p in positions), dtype=np.float64, count=count)
+        entries = np.fromiter((p.get("entry_price") or 0.0 for p in positions), dtype=np.float64, count=count)
+        signs = np.fromiter((-1.0 if p["direction"] == "short" else 1.0 for p in positions), dtype=np.float64, count=count)
+
+        known = entries > 0
+        pnls = np.zeros(count)
+        pnls[known] = sizes[known] * signs[known] * (price - entries[known]) / entries[known]
+
+        self.active_positions.clear()
+        return pnls
+
+    def ingest_pnl_batch(self, pnls: np.ndarray):
+        """청산 손익 일괄 반영"""
+        self.realized_pnl += float(np.sum(pnls))
@@ -120,7 +120,7 @@ class AutoTrader:
         if self._trading_engine is None:
             try:
                 from core.trading_engine import TradingEngine
-                self._trading_engine = TradingEngine()
+                self._trading_engine = TradingEngine(prewarm=True)
                 self.logger.info("TradingEngine 로드 완료")
             except Exception as e:
                 self.logger.error(f"TradingEngine 로드 실패: {e}")
@@ -0,0 +1,117 @@
+"""
+OHLCV 링 버퍼
+- 심볼/타임프레임별 캔들을 연속된 numpy 배열 하나에 누적
+- 최근 구간을 ndarray 뷰(내부용) 또는 독립된 DataFrame 복사본(전략 전달용)으로 제공
+"""
+from __future__ import annotations
+from typing import Optional
+import numpy as np
+import pandas as pd
+
+
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+class OHLCVRingBuffer:
+    def __init__(self, capacity: int = 2048):
+        self.capacity = capacity
+        # 용량의 2배를 잡아두고 끝에 닿으면 최근 구간을 앞으로 당겨 항상 연속된 뷰를 보장
+        self._data = np.empty((capacity * 2, len(OHLCV_COLUMNS)), dtype=np.float64)
+        self._timestamps = np.empty(capacity * 2, dtype='datetime64[ns]')
+        self._start = 0
+        self._head = 0
+
+    def __len__(self) -> int:
+        return self._head - self._start
+
+    @property
+    def last_timestamp(self) -> Optional[np.datetime64]:
+        if self._head == self._start:
+            return None
+        ts = self._timestamps[self._head - 1]
+        return None if np.isnat(ts) else ts
+
+    def clear(self):
+        self._start = 0
+        self._head = 0
+
+    def _compact(self):
+        """저장 구간을 배열 앞쪽으로 이동"""
+        size = len(self)
+        self._data[:size] = self._data[self._start:self._head]
+        self._timestamps[:size] = self._timestamps[self._start:self._head]
+        self._start = 0
+        self._head = size
+
+    def _write(self, rows: np.ndarray, timestamps: np.ndarray):
+        count = len(rows)
+        if count >= self.capacity:
+            # 용량 이상이 한 번에 들어오면 최근 구간만 유지
+            rows = rows[-self.capacity:]
+            timestamps = timestamps[-self.capacity:]
+            count = self.capacity
+            self.clear()
+        elif self._head + count > len(self._data):
+            self._compact()
+
+        self._data[self._head:self._head + count] = rows
+        self._timestamps[self._head:self._head + count] = timestamps
+        self._head += count
+        if len(self) > self.capacity:
+            self._start = self._head - self.capacity
+
+    def append(self, timestamp, row) -> bool:
+        """캔들 1개 추가 (마지막 캔들보다 이전 시각이면 무시)"""
+        ts = np.datetime64(pd.Timestamp(timestamp), 'ns')
+        last = self.last_timestamp
+        if last is not None and ts <= last:
+            return False
+        self._write(np.asarray(row, dtype=np.float64).reshape(1, -1), np.array([ts]))
+        return True
+
+    def extend(self, df: pd.DataFrame) -> int:
+        """DataFrame의 새 캔들만 추가하고 추가된 개수 반환
+
+        마지막 캔들과 시각이 같은 행은 진행 중인 캔들로 보고 값을 갱신한다.
+        시간 인덱스(또는 timestamp 컬럼)가 없으면 기존 내용을 통째로 교체한다.
+        """
+        rows = df[OHLCV_COLUMNS].to_numpy(dtype=np.float64)
+        if isinstance(df.index, pd.DatetimeIndex):
+            timestamps = df.index.values.astype('datetime64[ns]')
+        elif 'timestamp' in df.columns:
+            timestamps = pd.to_datetime(df['timestamp']).values.astype('datetime64[ns]')
+        else:
+            self.clear()
+            self._write(rows, np.full(len(rows), np.datetime64('NaT'), dtype='datetime64[ns]'))
+            return len(rows)
+
+        last = self.last_timestamp
+        if last is not None:
+            same = timestamps == last
+            if same.any():
+                self._data[self._head - 1] = rows[same][-1]
+            mask = timestamps > last
+            rows = rows[mask]
+            timestamps = timestamps[mask]
+        if len(rows):
+            self._write(rows, timestamps)
+        return len(rows)
+
+    def view(self, n: Optional[int] = None) -> np.ndarray:
+        """최근 n개 캔들의 (n, 5) ndarray 뷰 (복사 없음)"""
+        start = self._start if n is None else max(self._start, self._head - n)
+        return self._data[start:self._head]
+
+    def to_dataframe(self, n: Optional[int] = None) -> pd.DataFrame:
+        """최근 n개 캔들을 DataFrame 복사본으로 반환
+
+        이후 extend/clear가 마지막 행을 덮어쓰거나 버퍼를 재사용해도 이미 전달된
+        DataFrame(캐시된 프레임, 다른 스레드가 읽는 중인 프레임)은 바뀌지 않아야 하므로
+        버퍼 메모리를 공유하지 않는다 (200x5 float64 구간 기준 8KB 복사).
+        """
+        start = self._start if n is None else max(self._start, self._head - n)
+        index = None
+        if self.last_timestamp is not None:
+            index = pd.DatetimeIndex(self._timestamps[start:self._head].copy(), name='timestamp')
+        return pd.DataFrame(self._data[start:self._head].copy(), columns=OHLCV_COLUMNS,
+                            index=index, copy=False)
@@ -3,6 +3,7 @@
 - 최소 기록 기능만 제공
 """
 from __future__ import annotations
+import threading
 from typing import Any, Dict
 from datetime import datetime
 
@@ -10,10 +11,13 @@ from datetime import datetime
 class PerformanceMonitor:
     def __init__(self):
         self._trade_id = 0
+        # 신호 워커 스레드들이 동시에 기록하므로 거래 ID 증가는 락 안에서
+        self._lock = threading.Lock()
 
     def record_trade(self, strategy_id: str, action: str, price: float, quantity: float, amount: float, confidence: float, reasoning: str) -> int:
-        self._trade_id += 1
-        return self._trade_id
+        with self._lock:
+            self._trade_id += 1
+            return self._trade_id
 
     def open_position(self, strategy_id: str, entry_price: float, quantity: float, side: str):
         # 최소 구현
@@ -4,6 +4,7 @@
 """
 
 import logging
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
@@ -54,6 +55,8 @@ class PositionManager:
         self.api = api_client
         self.positions: Dict[str, Position] = {}
         self.closed_positions = []
+        # 실시간 시세 스레드와 주문 스레드가 함께 positions를 변경하므로 추가/삭제는 락 안에서만
+        self._lock = threading.Lock()
         self.logger = self._setup_logger()
         
         # 포지션 관리 설정
@@ -138,7 +141,8 @@ class PositionManager:
             trailing_stop=self.config.get_config('risk_management.trailing_stop_enabled')
         )
         
-        self.positions[position.id] = position
+        with self._lock:
+            self.positions[position.id] = position
         self.logger.info(f"포지션 생성: {position.id} - {strategy_id} {side} {size:.8f} @ {entry_price:,.0f}")
         
         return position
@@ -165,7 +169,8 @@ class PositionManager:
         """모든 포지션 업데이트"""
         positions_to_close = []
         
-        for position_id, position in self.positions.items():
+        # 다른 스레드가 포지션을 추가/종료해도 순회가 깨지지 않도록 스냅샷으로 순회
+        for position_id, position in tuple(self.positions.items()):
             current_price = current_prices.get(position.symbol)
             if not current_price:
                 continue
@@ -228,13 +233,17 @@ class PositionManager:
         return False
 
     def close_position(self, position_id: str, reason: str = "수동 종료") -> bool:
-        """포지션 종료"""
-        if position_id not in self.positions:
+        """포지션 종료
+        
+        주문 전에 락 안에서 positions에서 꺼내므로 같은 포지션을 두 스레드가 동시에 종료해도
+        주문은 한 번만 나간다. 주문이 실패하면 포지션을 되돌려 놓는다.
+        """
+        with self._lock:
+            position = self.positions.pop(position_id, None)
+        if position is None:
             self.logger.warning(f"존재하지 않는 포지션: {position_id}")
             return False
         
-        position = self.positions[position_id]
-        
         # 실제 매도 주문 실행 (모의거래에서는 시뮬레이션)
         if position.side == 'long':
             # 매도 주문 - 시장가 매도
@@ -242,6 +251,7 @@ class PositionManager:
             min_btc_volume = 0.0001
             if position.size < min_btc_volume:
                 self.logger.warning(f"포지션 크기({position.size:.8f})가 최소 주문 수량({min_btc_volume})보다 작습니다")
+                self._restore_position(position)
                 return False
             
             result = self.api.place_sell_order(position.symbol, position.current_price, position.size)
@@ -252,15 +262,21 @@ class PositionManager:
         if result.success:
             # 포지션을 종료 목록으로 이동
             position.status = 'closed'
-            self.closed_positions.append(position)
-            del self.positions[position_id]
+            with self._lock:
+                self.closed_positions.append(position)
             
             self.logger.info(f"포지션 종료 완료: {position_id} - {reason} (PnL: {position.unrealized_pnl:+,.0f})")
             return True
         else:
+            self._restore_position(position)
             self.logger.error(f"포지션 종료 실패: {position_id} - {result.message}")
             return False
 
+    def _restore_position(self, position: Position):
+        """종료하지 못한 포지션을 다시 열린 포지션으로 등록"""
+        with self._lock:
+            self.positions[position.id] = position
+
     def get_position_summary(self) -> PositionSummary:
         """포지션 요약 정보"""
         total_exposure = self.get_total_exposure()
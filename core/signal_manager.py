@@ -92,18 +92,20 @@ class SignalManager:
         """활성 전략들로부터 신호 수집"""
         valid_signals = []
         min_confidence = self.config.get_config('strategies.min_signal_strength')
+        # 만료 기준은 신호마다 다시 조회하지 않고 한 번만 계산
+        timeout_seconds = self.config.get_config('strategies.signal_timeout_minutes') * 60
+        now = datetime.now()
         
         for strategy_id, signal in strategy_signals.items():
             if signal and signal.confidence >= min_confidence:
                 # 시간 기반 신호 유효성 검증
-                signal_age = datetime.now() - signal.timestamp
-                timeout_minutes = self.config.get_config('strategies.signal_timeout_minutes')
+                signal_age = now - signal.timestamp
                 
-                if signal_age.total_seconds() <= timeout_minutes * 60:
+                if signal_age.total_seconds() <= timeout_seconds:
                     valid_signals.append(signal)
-                    self.logger.debug(f"신호 수집: {strategy_id} - {signal.action} (신뢰도: {signal.confidence:.2f})")
+                    self.logger.debug("신호 수집: %s - %s (신뢰도: %.2f)", strategy_id, signal.action, signal.confidence)
                 else:
-                    self.logger.warning(f"신호 만료: {strategy_id} (나이: {signal_age})")
+                    self.logger.warning("신호 만료: %s (나이: %s)", strategy_id, signal_age)
         
         return valid_signals
 
@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import threading
+import pandas as pd
 
 
 @dataclass
@@ -22,12 +23,25 @@ class RecordedSignal:
     executed: bool
 
 
+# 신호 기록 DataFrame 스키마 (dtype 추론 없이 컬럼별로 바로 생성)
+SIGNAL_DTYPES: Dict[str, Any] = {
+    "strategy_id": "string",
+    "action": pd.CategoricalDtype(["buy", "sell", "hold"]),
+    "confidence": "float32",
+    "price": "float64",
+    "suggested_amount": "Int64",
+    "reasoning": "string",
+    "timestamp": "datetime64[ns]",
+    "executed": "boolean",
+}
+
+
 class SignalRecorder:
     def __init__(self):
         self._signals: List[RecordedSignal] = []
         self._consolidated: List[Dict[str, Any]] = []
         self._analysis_sessions: List[Dict[str, Any]] = []
-        self._lock = threading.Lock()
+        self._lock = threading.RLock()  # record_* 메서드가 잠금 상태에서 _next_id를 호출하므로 재진입 허용
         self._id = 0
 
     def _next_id(self) -> int:
@@ -65,13 +79,24 @@ class SignalRecorder:
             rid = self._next_id()
         return rid
 
-    def get_signal_history(self, strategy_id: Optional[str], days: int = 7) -> List[Dict[str, Any]]:
+    def _filter_signals(self, strategy_id: Optional[str], days: int) -> List[RecordedSignal]:
         cutoff = datetime.now() - timedelta(days=days)
         with self._lock:
             sigs = [s for s in self._signals if s.timestamp >= cutoff]
         if strategy_id:
             sigs = [s for s in sigs if s.strategy_id == strategy_id]
-        return [s.__dict__ for s in sigs]
+        return sigs
+
+    def get_signal_history(self, strategy_id: Optional[str], days: int = 7) -> List[Dict[str, Any]]:
+        return [s.__dict__ for s in self._filter_signals(strategy_id, days)]
+
+    def get_signal_frame(self, strategy_id: Optional[str] = None, days: int = 7) -> pd.DataFrame:
+        """신호 기록을 고정 스키마(SIGNAL_DTYPES)의 DataFrame으로 반환"""
+        sigs = self._filter_signals(strategy_id, days)
+        return pd.DataFrame({
+            col: pd.array([getattr(s, col) for s in sigs], dtype=dtype)
+            for col, dtype in SIGNAL_DTYPES.items()
+        })
 
     def analyze_signal_performance(self, days: int = 7) -> Dict[str, Any]:
         cutoff = datetime.now() - timedelta(days=days)
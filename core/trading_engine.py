@@ -5,84 +5,167 @@
 
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# 스크립트로 직접 실행할 때만 프로젝트 루트를 import 경로에 추가 (main.py, web/app.py 등 진입점은 이미 추가함)
+if __name__ == "__main__":
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import time
+import heapq
+import queue
+import atexit
+import asyncio
 import threading
 import schedule
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import logging
+import logging.handlers
 from dataclasses import dataclass
+from functools import partial
+from types import SimpleNamespace
 
 from config.config_manager import config_manager
-from core.upbit_api import UpbitAPI, OrderResult, MarketData
+from core.upbit_api import UpbitAPI, OrderResult
 from core.signal_manager import SignalManager, TradingSignal, ConsolidatedSignal, MarketCondition
 from core.position_manager import PositionManager
-from core.advanced_risk_manager import AdvancedRiskManager
-from core.enhanced_strategy_implementation import EnhancedStrategyAnalyzer
-from core.strategy_router import StrategyRouter
-from core.data_collector import DataCollector
-from core.performance_monitor import PerformanceMonitor
 from core.signal_recorder import signal_recorder
+from core.ohlcv_buffer import OHLCVRingBuffer, OHLCV_COLUMNS
+from core.upbit_ws import UpbitTickerStream
 from strategy_manager import StrategyManager, TradeRecord
 import pandas as pd
 import numpy as np
-# TA-Lib import를 조건부로 처리
-try:
-    import talib
-    TALIB_AVAILABLE = True
-except ImportError:
-    TALIB_AVAILABLE = False
-    logging.warning("TA-Lib not available. Some technical indicators will use fallback implementations.")
+
+# 거래 경로에서 반복 사용되는 심볼/식별자 상수 (인터닝하여 재사용)
+SYM_KRWBTC = sys.intern("KRW-BTC")
+SYM_KRW = sys.intern("KRW")
+SYM_BTC = sys.intern("BTC")
+SIDE_LONG = sys.intern("long")
+STRATEGY_MULTI = sys.intern("multi_strategy")
+
+# H7 전략용 OI 데이터 (실제로는 API에서 가져와야 함)
+_H7_ADDITIONAL_DATA = {
+    'oi_data': {
+        'current': 1000000,
+        'previous': 950000,
+        'long_ratio': 0.52
+    },
+    'funding_rate': 0.01
+}
+
+# Upbit 캔들 응답 필드 (OHLCV_COLUMNS 순서)
+_CANDLE_FIELDS = ('opening_price', 'high_price', 'low_price', 'trade_price', 'candle_acc_trade_volume')
+
+def _next_midnight_ts() -> float:
+    """다음 자정(로컬 시간)의 Unix 타임스탬프"""
+    tomorrow = datetime.now().date() + timedelta(days=1)
+    return datetime.combine(tomorrow, datetime.min.time()).timestamp()
+
+
+def _config_key_affected(keys: Tuple[str, ...], key_path: str) -> bool:
+    """변경된 설정 경로가 keys 중 하나이거나 그 상위 섹션인지 확인"""
+    prefix = key_path + '.'
+    return any(key == key_path or key.startswith(prefix) for key in keys)
+
+
+MIN_TRADE_AMOUNT = 10000  # 최소 거래 금액 (원)
+FEE_RATE = 0.0005  # 거래 수수료율 (0.05%)
+
+
+def size_order(amount: float, price: float, kelly_size: float, max_risk: float,
+               fee_rate: float = FEE_RATE) -> Tuple[float, float, float]:
+    """주문 크기 산출 - (매수 수량, 수수료, 조정 금액) 반환
+
+    조정 금액은 제안 금액, Kelly 포지션 크기, 최대 리스크 금액 중 최솟값이며
+    수수료는 제안 금액 기준으로 계산한다.
+    """
+    adjusted_amount = min(amount, kelly_size, max_risk)
+    return adjusted_amount / price, amount * fee_rate, adjusted_amount
 
 # Position 클래스는 position_manager.py에서 가져옴
 
 class RiskManager:
+    # can_trade가 참조하는 설정 키 (변경 시 캐시 갱신)
+    LIMIT_CONFIG_KEYS = (
+        'system.enabled',
+        'trading.auto_trade_enabled',
+        'trading.daily_loss_limit',
+        'trading.emergency_stop_loss',
+        'risk_management.max_daily_trades',
+    )
+
     def __init__(self, config_manager):
         self.config = config_manager
         self.daily_pnl = 0
         self.daily_trades = 0
         self.last_reset = datetime.now().date()
+        self._next_reset_ts = _next_midnight_ts()
         self.consecutive_losses = 0
         self.logger = logging.getLogger('RiskManager')
+        
+        # 활성화 여부/한도 설정은 매 신호마다 조회하지 않고 설정이 바뀐 뒤 첫 확인 때만 갱신
+        self._cached_limits = SimpleNamespace()
+        self._limits_dirty = True
+        self.config.register_callback(self._on_config_change)
+
+    def _refresh_cached_limits(self):
+        """활성화 여부 및 거래 한도 설정 캐시 갱신"""
+        self._limits_dirty = False
+        self._cached_limits = SimpleNamespace(
+            system_enabled=self.config.is_system_enabled(),
+            trading_enabled=self.config.is_trading_enabled(),
+            daily_loss=self.config.get_config('trading.daily_loss_limit'),
+            emergency_stop=self.config.get_emergency_stop_loss(),
+            max_trades=self.config.get_config('risk_management.max_daily_trades')
+        )
+
+    def _on_config_change(self, key_path: str, new_value, old_value):
+        """관련 설정(또는 상위 섹션)이 바뀌면 다음 can_trade에서 캐시 갱신"""
+        if _config_key_affected(self.LIMIT_CONFIG_KEYS, key_path):
+            self._limits_dirty = True
+
+    def close(self):
+        """설정 변경 콜백 해제 (엔진 종료 시 호출)"""
+        self.config.unregister_callback(self._on_config_change)
 
     def reset_daily_stats(self):
-        """일일 통계 리셋"""
-        today = datetime.now().date()
-        if today != self.last_reset:
+        """일일 통계 리셋 (매 확인마다 날짜 객체를 만들지 않고 다음 자정 시각과 비교)"""
+        if time.time() >= self._next_reset_ts:
             self.daily_pnl = 0
             self.daily_trades = 0
-            self.last_reset = today
+            self.last_reset = datetime.now().date()
+            self._next_reset_ts = _next_midnight_ts()
             self.logger.info("일일 통계 리셋됨")
 
     def can_trade(self) -> Tuple[bool, str]:
         """거래 가능 여부 확인"""
         self.reset_daily_stats()
         
+        if self._limits_dirty:
+            self._refresh_cached_limits()
+        limits = self._cached_limits
+        
         # 시스템 활성화 확인
-        if not self.config.is_system_enabled():
+        if not limits.system_enabled:
             return False, "시스템이 비활성화됨"
         
         # 자동거래 활성화 확인
-        if not self.config.is_trading_enabled():
+        if not limits.trading_enabled:
             return False, "자동거래가 비활성화됨"
         
         # 일일 손실 한도 확인
-        daily_loss_limit = self.config.get_config('trading.daily_loss_limit')
-        if self.daily_pnl <= -daily_loss_limit:
+        if self.daily_pnl <= -limits.daily_loss:
             return False, f"일일 손실 한도 초과: {self.daily_pnl:,.0f}"
         
         # 긴급 정지 손실 확인
-        emergency_stop = self.config.get_emergency_stop_loss()
         total_loss = self.get_total_loss()
-        if total_loss >= emergency_stop:
+        if total_loss >= limits.emergency_stop:
             self.config.emergency_stop()
             return False, f"긴급 정지 손실 도달: {total_loss:,.0f}"
         
         # 일일 거래 횟수 확인
-        max_daily_trades = self.config.get_config('risk_management.max_daily_trades')
-        if self.daily_trades >= max_daily_trades:
+        if self.daily_trades >= limits.max_trades:
             return False, f"일일 거래 한도 초과: {self.daily_trades}"
         
         return True, "거래 가능"
@@ -105,15 +188,15 @@ class RiskManager:
         result = position_sizer.calculate_position_size(signal_dict, balance)
         
         # 로그 출력
-        self.logger.info(f"포지션 크기 계산: {result.reason}")
-        self.logger.info(f"방법: {result.method}, 리스크: {result.risk_level}")
+        self.logger.info("포지션 크기 계산: %s", result.reason)
+        self.logger.info("방법: %s, 리스크: %s", result.method, result.risk_level)
         
         return result.amount
 
     def get_total_loss(self) -> float:
         """총 손실 계산 (임시 구현)"""
         # 실제로는 데이터베이스에서 총 손실을 계산해야 함
-        return abs(min(0, self.daily_pnl))
+        return max(0.0, -self.daily_pnl)
 
     def update_trade_result(self, pnl: float):
         """거래 결과 업데이트"""
@@ -131,61 +214,183 @@ class RiskManager:
             position_sizer = HybridPositionSizer(self.config)
             position_sizer.update_trade_result(pnl)
         except Exception as e:
-            self.logger.warning(f"포지션 크기 결정기 업데이트 실패: {e}")
+            self.logger.warning("포지션 크기 결정기 업데이트 실패: %s", e)
         
-        self.logger.info(f"거래 결과 업데이트: PnL={pnl:,.0f}, 일일PnL={self.daily_pnl:,.0f}")
+        self.logger.info("거래 결과 업데이트: PnL=%.0f, 일일PnL=%.0f", pnl, self.daily_pnl)
 
 class TradingEngine:
-    def __init__(self):
+    # 실시간 시세로 포지션을 재평가하는 최소 간격 (초)
+    REALTIME_CHECK_INTERVAL = 0.5
+    # 포지션 요약 로그 간격 (초)
+    POSITION_SUMMARY_INTERVAL = 600
+    # 전략 신호를 동시에 생성하는 워커 수
+    SIGNAL_WORKERS = 4
+    # 포지션 모니터링 API 조회를 동시에 보내는 워커 수
+    API_WORKERS = 4
+    # 같은 캔들 조회 결과를 전략들이 공유하는 최대 시간 (초)
+    MARKET_DATA_TTL = 30
+    # 교체된 API 세션을 닫기 전 진행 중인 요청을 기다리는 시간 (초, 요청 타임아웃 10초 x 재시도 포함)
+    API_CLOSE_DELAY = 60
+    # 신호 생성/처리에서 참조하는 설정 키 (변경 시 캐시 갱신)
+    SETTINGS_CONFIG_KEYS = (
+        'strategies.min_signal_strength',
+        'strategies.signal_timeout_minutes',
+    )
+
+    def __init__(self, prewarm: bool = False):
         self.config = config_manager
-        self.api = UpbitAPI()  # 실거래 API
+        # 상주 서비스(main/AutoTrader)에서만 prewarm=True로 연결 예열
+        self._prewarm = prewarm
+        self.api = UpbitAPI(prewarm=prewarm)  # 실거래 API
         self.strategy_manager = StrategyManager()
         self.risk_manager = RiskManager(self.config)
-        self.advanced_risk_manager = AdvancedRiskManager(self.config)  # 고급 리스크 관리자 추가
-        self.enhanced_strategy_analyzer = EnhancedStrategyAnalyzer()  # 개선된 전략 분석기 추가
         
-        # 새로운 통합 시스템
-        self.strategy_router = StrategyRouter(self.config.get_all_config())
-        self.data_collector = DataCollector()
-        self.performance_monitor = PerformanceMonitor()
+        # 보조 서브시스템은 처음 사용할 때 로드 (아래 property 참고)
+        self._advanced_risk_manager = None
+        self._enhanced_strategy_analyzer = None
+        self._strategy_router = None
+        self._data_collector = None
+        self._performance_monitor = None
         
         # 새로운 통합 관리자들
         self.signal_manager = SignalManager(self.config)
         self.position_manager = PositionManager(self.config, self.api)
         
         self.running = False
+        # 주문 스레드는 _new_orders에 추가만 하고, 모니터링 쪽에서 꺼내 pending_orders로 옮김
+        self._new_orders = deque()
         self.pending_orders = {}
+        # 타임아웃 확인용 (주문 monotonic 시각, 주문 ID) 최소 힙 - 체결된 주문 항목은 꺼낼 때 버림
+        self._order_expiry: List[Tuple[float, str]] = []
+        self._order_lock = threading.Lock()
+        
+        # 실시간 시세 스트림 (포지션 보유 시에만 손절/익절 재평가, 스케줄 모니터링은 워치독 역할)
+        self._price_stream = None
+        self._position_lock = threading.Lock()
+        self._last_realtime_check = 0.0
+        self._last_summary_log = 0.0
+        # start()에서 생성되는 이벤트 루프와 정지 신호 (stop()이 다른 스레드에서 깨움)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        
+        # 전략별 신호 생성 워커 풀
+        self._signal_pool = ThreadPoolExecutor(max_workers=self.SIGNAL_WORKERS,
+                                               thread_name_prefix='signal')
+        # 데이터 키별 조회 락 (같은 데이터만 기다리고 다른 데이터 조회는 동시에 진행)
+        self._data_locks: Dict[tuple, threading.Lock] = {}
+        self._data_lock = threading.Lock()  # _data_locks 보호용
+        # 주문 상태/현재가 조회를 병렬로 보내는 워커 풀
+        self._api_pool = ThreadPoolExecutor(max_workers=self.API_WORKERS,
+                                            thread_name_prefix='api')
+        
+        # (심볼, 타임프레임)별 OHLCV 링 버퍼와 신호 수집 주기 내 공유 DataFrame
+        self._ohlcv_rings: Dict[Tuple[str, str], OHLCVRingBuffer] = {}
+        self._cycle_frames: Optional[Dict[Tuple[str, str], Optional[pd.DataFrame]]] = None
+        
+        # (심볼, 개수, 분봉 단위)별 캔들 DataFrame 캐시: (만료 시각, DataFrame)
+        self._market_frames: Dict[Tuple[str, int, int], Tuple[float, pd.DataFrame]] = {}
+        # (심볼, 분봉 단위)별 API 캔들 링 버퍼 (채워진 뒤에는 최신 캔들만 조회)
+        self._candle_rings: Dict[Tuple[str, int], OHLCVRingBuffer] = {}
+        
+        # 전략별 추가 데이터 준비 함수 (등록되지 않은 전략은 추가 데이터 없음)
+        self._additional_data_builders = {
+            "h7": partial(dict, _H7_ADDITIONAL_DATA),
+            "d1": self._d1_additional_data,
+        }
         
         self.logger = self._setup_logger()
+        
+        # 신호마다 설정을 조회하지 않고 설정 변경 시에만 갱신
+        self._cached_settings = SimpleNamespace()
+        self._refresh_cached_settings()
         self._setup_config_callbacks()
+        # 엔진 전용 스케줄러 (전역 schedule에 등록하면 엔진을 생성만 한 AutoTrader/웹 프로세스의
+        # run_pending에서도 실행되고 인스턴스를 만들 때마다 작업이 중복 등록됨)
+        self._scheduler = schedule.Scheduler()
         self._schedule_tasks()
         
         self.logger.info("통합 트레이딩 엔진 초기화 완료")
 
+    @property
+    def advanced_risk_manager(self):
+        """고급 리스크 관리자 (지연 로드)"""
+        if self._advanced_risk_manager is None:
+            from core.advanced_risk_manager import AdvancedRiskManager
+            self._advanced_risk_manager = AdvancedRiskManager(self.config)
+        return self._advanced_risk_manager
+
+    @property
+    def enhanced_strategy_analyzer(self):
+        """개선된 전략 분석기 (지연 로드)"""
+        if self._enhanced_strategy_analyzer is None:
+            from core.enhanced_strategy_implementation import EnhancedStrategyAnalyzer
+            self._enhanced_strategy_analyzer = EnhancedStrategyAnalyzer()
+        return self._enhanced_strategy_analyzer
+
+    @property
+    def strategy_router(self):
+        """통합 전략 라우터 (지연 로드)"""
+        if self._strategy_router is None:
+            from core.strategy_router import StrategyRouter
+            self._strategy_router = StrategyRouter(self.config.get_all_config())
+        return self._strategy_router
+
+    @property
+    def data_collector(self):
+        """히스토리컬 데이터 수집기 (지연 로드)"""
+        if self._data_collector is None:
+            from core.data_collector import DataCollector
+            self._data_collector = DataCollector()
+        return self._data_collector
+
+    @property
+    def performance_monitor(self):
+        """퍼포먼스 모니터 (지연 로드)"""
+        if self._performance_monitor is None:
+            from core.performance_monitor import PerformanceMonitor
+            self._performance_monitor = PerformanceMonitor()
+        return self._performance_monitor
+
     def _setup_logger(self) -> logging.Logger:
         logger = logging.getLogger('TradingEngine')
         logger.setLevel(logging.INFO)
         
         if not logger.handlers:
-            # 파일 핸들러 추가
+            # 파일 핸들러
             file_handler = logging.FileHandler('logs/trading_engine.log')
             file_formatter = logging.Formatter(
                 '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
             )
             file_handler.setFormatter(file_formatter)
-            logger.addHandler(file_handler)
             
-            # 콘솔 핸들러 추가
+            # 콘솔 핸들러
             console_handler = logging.StreamHandler()
             console_handler.setFormatter(file_formatter)
-            logger.addHandler(console_handler)
+            
+            # 거래 스레드는 큐에 넣기만 하고 파일/콘솔 출력은 백그라운드 리스너 스레드가 담당
+            log_queue = queue.SimpleQueue()
+            logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+            listener.start()
+            # 종료 시 큐에 남은 로그를 모두 기록
+            atexit.register(listener.stop)
         
         return logger
 
+    def _refresh_cached_settings(self):
+        """신호 관련 설정 캐시 갱신"""
+        self._cached_settings = SimpleNamespace(
+            min_confidence=self.config.get_config('strategies.min_signal_strength'),
+            signal_timeout=self.config.get_config('strategies.signal_timeout_minutes')
+        )
+
     def _setup_config_callbacks(self):
         """설정 변경 콜백 등록"""
         def on_config_change(key_path: str, new_value, old_value):
-            self.logger.info(f"설정 변경 감지: {key_path} = {old_value} -> {new_value}")
+            self.logger.info("설정 변경 감지: %s = %s -> %s", key_path, old_value, new_value)
+            
+            if _config_key_affected(self.SETTINGS_CONFIG_KEYS, key_path):
+                self._refresh_cached_settings()
             
             if key_path == 'system.enabled':
                 if new_value:
@@ -201,69 +406,138 @@ class TradingEngine:
                     
             elif key_path == 'system.mode':
                 self.logger.critical("실거래 모드로 전환! 주의 필요")
-                self.api = UpbitAPI()
+                old_api = self.api
+                self.api = self.position_manager.api = UpbitAPI(prewarm=self._prewarm)
+                # 다른 스레드가 이전 인스턴스로 보낸 요청이 끝난 뒤에 세션 종료
+                closer = threading.Timer(self.API_CLOSE_DELAY, old_api.close)
+                closer.daemon = True
+                closer.start()
 
+        # stop()에서 해제할 수 있도록 참조 유지
+        self._config_callback = on_config_change
         self.config.register_callback(on_config_change)
 
     def _schedule_tasks(self):
         """작업 스케줄링"""
         # 1시간마다 시간 전략 실행
-        schedule.every().hour.at(":00").do(self.execute_hourly_strategies)
+        self._scheduler.every().hour.at(":00").do(self.execute_hourly_strategies)
         
         # 매일 0시에 일일 전략 실행
-        schedule.every().day.at("00:00").do(self.execute_daily_strategies)
+        self._scheduler.every().day.at("00:00").do(self.execute_daily_strategies)
         
         # 설정 기반 포지션 모니터링 간격
         monitoring_interval = self.config.get_monitoring_config().get('position_monitoring', {}).get('check_interval_seconds', 30)
-        schedule.every(monitoring_interval // 60 if monitoring_interval >= 60 else 1).minutes.do(self.monitor_positions)
+        self._scheduler.every(monitoring_interval // 60 if monitoring_interval >= 60 else 1).minutes.do(self.monitor_positions)
         
         # 매일 성능 체크
-        schedule.every().day.at("23:59").do(self.strategy_manager.daily_performance_check)
+        self._scheduler.every().day.at("23:59").do(self.strategy_manager.daily_performance_check)
 
     def start(self):
         """트레이딩 엔진 시작"""
         self.running = True
         self.logger.info("트레이딩 엔진 시작됨")
         
-        # 스케줄 실행 스레드
-        schedule_thread = threading.Thread(target=self._run_scheduler, daemon=True)
-        schedule_thread.start()
+        # 실시간 시세 구독
+        self._price_stream = UpbitTickerStream([SYM_KRWBTC], self._on_realtime_price)
+        self._price_stream.start()
         
-        # 메인 모니터링 루프
-        self._main_loop()
+        # 스케줄러와 메인 모니터링 루프를 하나의 이벤트 루프에서 실행
+        try:
+            asyncio.run(self._run_async())
+        except KeyboardInterrupt:
+            self.logger.info("사용자에 의해 중단됨")
+            self.running = False
 
     def stop(self):
-        """트레이딩 엔진 정지"""
+        """트레이딩 엔진 정지 (start()로 다시 시작 가능, 자원 해제는 close())"""
         self.running = False
+        if self._price_stream:
+            self._price_stream.stop()
+        
+        # 대기 중인 루프를 즉시 깨움
+        loop, stop_event = self._loop, self._stop_event
+        if loop is not None and stop_event is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(stop_event.set)
         self.logger.info("트레이딩 엔진 정지됨")
 
-    def _run_scheduler(self):
-        """스케줄러 실행"""
+    def close(self):
+        """엔진 자원 해제 - 더 이상 쓰지 않을 때 한 번 호출
+        
+        ConfigManager가 콜백을 잡고 있으면 엔진이 수거되지 않으므로 콜백도 해제한다.
+        """
+        self.stop()
+        self._signal_pool.shutdown(wait=False, cancel_futures=True)
+        self._api_pool.shutdown(wait=False, cancel_futures=True)
+        self.config.unregister_callback(self._config_callback)
+        self.risk_manager.close()
+        self.api.close()
+
+    async def _run_async(self):
+        """스케줄러/모니터링 코루틴 실행"""
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        try:
+            await asyncio.gather(self._run_scheduler(), self._main_loop())
+        finally:
+            self._loop = None
+            self._stop_event = None
+
+    async def _sleep(self, seconds: float) -> bool:
+        """정지 요청이 오면 바로 깨어나는 대기 (정지되었으면 True)"""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=seconds)
+            return True
+        except asyncio.TimeoutError:
+            return not self.running
+
+    def _on_realtime_price(self, market: str, price: float):
+        """실시간 체결가 수신 - 열린 포지션이 있을 때만 손절/익절 재평가"""
+        if not self.position_manager.positions:
+            return
+        
+        now = time.monotonic()
+        if now - self._last_realtime_check < self.REALTIME_CHECK_INTERVAL:
+            return
+        self._last_realtime_check = now
+        
+        try:
+            with self._position_lock:
+                self.position_manager.update_positions({market: price})
+        except Exception as e:
+            self.logger.error(f"실시간 포지션 업데이트 오류: {e}")
+
+    async def _run_scheduler(self):
+        """스케줄러 실행 (작업은 API 호출로 블로킹되므로 실행기 스레드에서 수행)"""
+        loop = asyncio.get_running_loop()
         while self.running:
-            schedule.run_pending()
-            # 설정 기반 스케줄러 체크 간격
-            scheduler_interval = min(60, self.config.get_trading_config().get('trade_interval_minutes', 10) * 60 // 10)
-            time.sleep(scheduler_interval)
+            try:
+                await loop.run_in_executor(None, self._scheduler.run_pending)
+            except Exception as e:
+                self.logger.error(f"스케줄 작업 오류: {e}")
+            # 다음 작업 시각까지만 대기 (등록된 작업이 없으면 1분 뒤 다시 확인)
+            idle = self._scheduler.idle_seconds
+            if await self._sleep(60 if idle is None else max(0.0, idle)):
+                break
 
-    def _main_loop(self):
+    async def _main_loop(self):
         """메인 모니터링 루프"""
+        loop = asyncio.get_running_loop()
         while self.running:
             try:
                 # 기본 상태 체크
                 if self.config.is_system_enabled():
-                    self.monitor_positions()
-                    self.process_pending_orders()
+                    await loop.run_in_executor(None, self.monitor_positions)
+                    await loop.run_in_executor(None, self.process_pending_orders)
                 
                 # 설정 기반 체크 간격
                 check_interval = self.config.get_monitoring_config().get('position_monitoring', {}).get('check_interval_seconds', 30)
-                time.sleep(check_interval)
+                if await self._sleep(check_interval):
+                    break
                 
-            except KeyboardInterrupt:
-                self.logger.info("사용자에 의해 중단됨")
-                break
             except Exception as e:
                 self.logger.error(f"메인 루프 오류: {e}")
-                time.sleep(60)  # 오류 시 1분 대기
+                if await self._sleep(60):  # 오류 시 1분 대기
+                    break
 
     def execute_hourly_strategies(self):
         """시간 단위 전략 실행 - 다층 전략 시스템 사용"""
@@ -280,7 +554,7 @@ class TradingEngine:
             # 거래 비활성화 시: 신호 계산/기록만 수행하고 주문 실행은 생략
             if not self.config.is_trading_enabled():
                 if consolidated_signal:
-                    self.logger.info(f"거래 비활성화 상태 - 다층 신호({consolidated_signal.action})만 기록, 주문 미실행")
+                    self.logger.info("거래 비활성화 상태 - 다층 신호(%s)만 기록, 주문 미실행", consolidated_signal.action)
                 return
             
             # 3. 통합 신호 처리 (거래 활성화 시에만)
@@ -305,7 +579,7 @@ class TradingEngine:
         # 거래 비활성화 시: 신호 계산/기록만 수행하고 주문 실행은 생략
         if not self.config.is_trading_enabled():
             if consolidated_signal:
-                self.logger.info(f"거래 비활성화 상태 - 신호({consolidated_signal.action})만 기록, 주문 미실행")
+                self.logger.info("거래 비활성화 상태 - 신호(%s)만 기록, 주문 미실행", consolidated_signal.action)
             return
         
         # 3. 통합 신호 처리 (거래 활성화 시에만)
@@ -321,23 +595,41 @@ class TradingEngine:
         else:
             active_strategies = self.strategy_manager.get_active_strategies('daily')
         
-        for strategy_id, strategy in active_strategies.items():
-            try:
-                signal = self.generate_signal(strategy_id, strategy)
+        # 지연 로드 컴포넌트는 워커 스레드에서 중복 생성되지 않도록 먼저 생성
+        self.strategy_router
+        self.performance_monitor
+        
+        # 같은 주기의 전략들은 타임프레임별 히스토리컬 데이터를 한 번만 조회해 공유
+        self._cycle_frames = {}
+        try:
+            # 전략들은 서로 독립적이므로 워커 풀에서 동시에 신호 생성
+            items = list(active_strategies.items())
+            signals = self._signal_pool.map(
+                lambda item: self._generate_signal_safely(item[0], item[1]), items
+            )
+            for (strategy_id, _), signal in zip(items, signals):
                 if signal:
                     strategy_signals[strategy_id] = signal
-            except Exception as e:
-                self.logger.error(f"전략 {strategy_id} 신호 생성 오류: {e}")
+        finally:
+            self._cycle_frames = None
         
         return strategy_signals
 
+    def _generate_signal_safely(self, strategy_id: str, strategy: Dict) -> Optional[TradingSignal]:
+        """워커 스레드용 신호 생성 (예외는 로그만 남기고 None)"""
+        try:
+            return self.generate_signal(strategy_id, strategy)
+        except Exception as e:
+            self.logger.error(f"전략 {strategy_id} 신호 생성 오류: {e}")
+            return None
+
     def _consolidate_signals(self, strategy_signals: Dict[str, TradingSignal]) -> Optional[ConsolidatedSignal]:
         """신호 통합 처리"""
         if not strategy_signals:
             return None
         
         # 현재 시장 데이터 가져오기
-        market_data = self.api.get_market_data("KRW-BTC")
+        market_data = self.api.get_market_data(SYM_KRWBTC)
         if not market_data:
             self.logger.warning("시장 데이터를 가져올 수 없음")
             return None
@@ -409,7 +701,7 @@ class TradingEngine:
         # 거래 비활성화 시: 신호 계산/기록만 수행하고 주문 실행은 생략
         if not self.config.is_trading_enabled():
             if consolidated_signal:
-                self.logger.info(f"거래 비활성화 상태 - 신호({consolidated_signal.action})만 기록, 주문 미실행")
+                self.logger.info("거래 비활성화 상태 - 신호(%s)만 기록, 주문 미실행", consolidated_signal.action)
             return
         
         # 3. 통합 신호 처리 (거래 활성화 시에만)
@@ -422,7 +714,7 @@ class TradingEngine:
             # 리스크 관리 체크
             can_trade, reason = self.risk_manager.can_trade()
             if not can_trade:
-                self.logger.warning(f"거래 불가: {reason}")
+                self.logger.warning("거래 불가: %s", reason)
                 return
             
             if consolidated_signal.action == 'buy':
@@ -438,114 +730,107 @@ class TradingEngine:
         # 1. 고급 리스크 관리 - 손실 한도 체크
         loss_limits = self.advanced_risk_manager.check_loss_limits()
         if not loss_limits['can_trade']:
-            self.logger.warning(f"손실 한도로 거래 불가: {loss_limits['reason']}")
+            self.logger.warning("손실 한도로 거래 불가: %s", loss_limits['reason'])
             return
         
         # 2. 포지션 상관관계 체크
         correlation_check = self.advanced_risk_manager.check_position_correlation(
-            "KRW-BTC", "long"
+            SYM_KRWBTC, SIDE_LONG
         )
         if not correlation_check['allowed']:
-            self.logger.warning(f"포지션 상관관계 체크 실패: {correlation_check['reason']}")
+            self.logger.warning("포지션 상관관계 체크 실패: %s", correlation_check['reason'])
             return
         
-        # 3. 시장 데이터 가져오기 (ATR 계산용)
-        market_data = self.api.get_market_data("KRW-BTC")
+        # 3. 시장 데이터(ATR 계산용)와 KRW 잔고를 동시에 조회 (지연 시간 = 가장 느린 요청)
+        market_future = self._api_pool.submit(self.api.get_market_data, SYM_KRWBTC)
+        balance_future = self._api_pool.submit(self.api.get_balance, SYM_KRW)
+        
+        market_data = market_future.result()
         if not market_data:
             self.logger.error("시장 데이터 조회 실패")
             return
         
-        # 현재가 조회
-        current_price = self.api.get_current_price("KRW-BTC")
+        # 현재가는 같은 티커 응답에 포함되어 있으므로 별도로 조회하지 않음
+        current_price = market_data.price
         if not current_price:
             self.logger.error("현재가 조회 실패")
             return
         
         # 4. 고급 리스크 메트릭 계산
-        account_balance = self.api.get_balance("KRW")
-        
-        # DataFrame 생성 (실제로는 더 많은 데이터 필요)
-        df = pd.DataFrame({
-            'high': [market_data.high_price],
-            'low': [market_data.low_price],
-            'close': [current_price],
-            'volume': [market_data.volume]
-        })
+        account_balance = balance_future.result()
         
+        # 티커는 캔들 1개 분량이라 ATR을 추정할 수 없으므로 DataFrame 없이 기본 ATR 근사 사용
         risk_metrics = self.advanced_risk_manager.get_risk_metrics(
-            df=df,
+            df=None,
             entry_price=current_price,
-            direction="long",
+            direction=SIDE_LONG,
             signal_strength=signal.confidence,
             account_balance=account_balance
         )
         
-        # 5. Kelly Criterion 기반 포지션 크기 조정
-        adjusted_amount = min(
+        # 5. Kelly Criterion 기반 포지션 크기 조정 (매수 수량/수수료 함께 산출)
+        quantity, fees, adjusted_amount = size_order(
             signal.suggested_amount,
+            current_price,
             risk_metrics.position_size,
             loss_limits['max_risk_amount']
         )
         
-        if adjusted_amount < 10000:  # 최소 거래 금액
+        if adjusted_amount < MIN_TRADE_AMOUNT:
             self.logger.warning("조정된 포지션 크기가 최소 거래 금액 미만")
             return
         
         # 포지션 생성 가능 여부 확인
         can_open, reason = self.position_manager.can_open_position(
-            "multi_strategy", adjusted_amount
+            STRATEGY_MULTI, adjusted_amount
         )
         
         if not can_open:
-            self.logger.warning(f"포지션 생성 불가: {reason}")
+            self.logger.warning("포지션 생성 불가: %s", reason)
             return
         
-        # 매수 수량 계산
-        quantity = adjusted_amount / current_price
-        
         # 실제 매수 주문 실행
-        result = self.api.place_buy_order("KRW-BTC", current_price, amount=adjusted_amount)
+        result = self.api.place_buy_order(SYM_KRWBTC, current_price, amount=adjusted_amount)
         
         if result.success:
             # 고급 리스크 관리자에 포지션 추가
             self.advanced_risk_manager.add_position(
                 position_id=result.order_id,
-                symbol="KRW-BTC",
-                direction="long",
-                size=adjusted_amount
+                symbol=SYM_KRWBTC,
+                direction=SIDE_LONG,
+                size=adjusted_amount,
+                entry_price=current_price
             )
             
             # 포지션 생성
             position = self.position_manager.create_position(
-                strategy_id="multi_strategy",
-                symbol="KRW-BTC",
-                side="long",
+                strategy_id=STRATEGY_MULTI,
+                symbol=SYM_KRWBTC,
+                side=SIDE_LONG,
                 size=quantity,
                 entry_price=current_price
             )
             
             if position:
                 self.logger.info(
-                    f"통합 매수 완료: {adjusted_amount:,.0f}원 "
-                    f"(원래: {signal.suggested_amount:,.0f}원) "
-                    f"신뢰도: {signal.confidence:.2f}, "
-                    f"Kelly fraction: {risk_metrics.kelly_fraction:.3f}, "
-                    f"손절가: {risk_metrics.stop_loss:,.0f}, "
-                    f"리스크/리워드: {risk_metrics.risk_reward_ratio:.2f}, "
-                    f"기여전략: {signal.contributing_strategies}"
+                    "통합 매수 완료: %.0f원 (원래: %.0f원) 신뢰도: %.2f, Kelly fraction: %.3f, "
+                    "손절가: %.0f, 리스크/리워드: %.2f, 기여전략: %s",
+                    adjusted_amount, signal.suggested_amount, signal.confidence,
+                    risk_metrics.kelly_fraction, risk_metrics.stop_loss,
+                    risk_metrics.risk_reward_ratio, signal.contributing_strategies
                 )
                 
                 # 거래 기록 추가
                 trade_record = TradeRecord(
-                    strategy_id="multi_strategy",
+                    strategy_id=STRATEGY_MULTI,
                     entry_time=datetime.now(),
                     exit_time=None,
                     entry_price=current_price,
                     exit_price=None,
                     position_size=quantity,
-                    side='long',
+                    side=SIDE_LONG,
                     pnl=None,
-                    fees=signal.suggested_amount * 0.0005,
+                    fees=fees,
                     status='open'
                 )
                 self.strategy_manager.add_trade_record(trade_record)
@@ -556,37 +841,32 @@ class TradingEngine:
     def _execute_consolidated_sell(self, signal: ConsolidatedSignal):
         """통합 매도 신호 실행"""
         # 보유 BTC 확인
-        btc_balance = self.api.get_balance("BTC")
+        btc_balance = self.api.get_balance(SYM_BTC)
         if btc_balance < 0.0001:
             self.logger.warning("매도할 BTC 잔고 부족")
             return
         
         # 현재가 조회
-        current_price = self.api.get_current_price("KRW-BTC")
+        current_price = self.api.get_current_price(SYM_KRWBTC)
         if not current_price:
             self.logger.error("현재가 조회 실패")
             return
         
         # 전량 매도
-        result = self.api.place_sell_order("KRW-BTC", current_price, btc_balance)
+        result = self.api.place_sell_order(SYM_KRWBTC, current_price, btc_balance)
         
         if result.success:
-            # 고급 리스크 관리자에서 포지션 업데이트
-            sell_amount = btc_balance * current_price
-            for position_id in list(self.advanced_risk_manager.active_positions.keys()):
-                # 실제 PnL 계산 (간단한 예시)
-                pnl = sell_amount * 0.01  # 실제로는 정확한 계산 필요
-                self.advanced_risk_manager.update_position(position_id, pnl)
+            # 고급 리스크 관리자 포지션 일괄 청산 (진입가 기준 실제 손익)
+            pnls = self.advanced_risk_manager.close_all_at(current_price)
+            self.advanced_risk_manager.ingest_pnl_batch(pnls)
             
-            # 관련 포지션들 종료
-            open_positions = list(self.position_manager.positions.keys())
-            for position_id in open_positions:
+            # 관련 포지션들 종료 (종료 시 positions에서 삭제되므로 키 튜플 스냅샷으로 순회)
+            for position_id in tuple(self.position_manager.positions):
                 self.position_manager.close_position(position_id, "통합 매도 신호")
             
             self.logger.info(
-                f"통합 매도 완료: {btc_balance:.8f} BTC "
-                f"(신뢰도: {signal.confidence:.2f}, "
-                f"기여전략: {signal.contributing_strategies})"
+                "통합 매도 완료: %.8f BTC (신뢰도: %.2f, 기여전략: %s)",
+                btc_balance, signal.confidence, signal.contributing_strategies
             )
         else:
             self.logger.error(f"통합 매도 실패: {result.message}")
@@ -595,30 +875,17 @@ class TradingEngine:
         """전략 신호 생성 - 통합 라우터 사용"""
         try:
             # 히스토리컬 데이터 우선 사용 (데이터베이스에서)
-            df = self._get_historical_dataframe("KRW-BTC", strategy_id)
+            df = self._get_historical_dataframe(SYM_KRWBTC, strategy_id)
             
             if df is None or len(df) < 50:
                 # 실시간 데이터 폴백
-                df = self._get_market_dataframe("KRW-BTC", period=200)
+                df = self._get_market_dataframe(SYM_KRWBTC, period=200)
                 if df is None or len(df) < 50:
                     return None
             
             # 추가 데이터 준비 (특정 전략용)
-            additional_data = {}
-            
-            # H7 전략용 OI 데이터 (실제로는 API에서 가져와야 함)
-            if strategy_id == "h7":
-                additional_data['oi_data'] = {
-                    'current': 1000000,
-                    'previous': 950000,
-                    'long_ratio': 0.52
-                }
-                additional_data['funding_rate'] = 0.01
-            
-            # D1 전략용 주봉 데이터
-            if strategy_id == "d1":
-                weekly_df = self._get_historical_dataframe("KRW-BTC", "weekly")
-                additional_data['weekly_df'] = weekly_df
+            builder = self._additional_data_builders.get(strategy_id)
+            additional_data = builder() if builder else {}
             
             # 전략 라우터를 통한 신호 생성
             signal = self.strategy_router.route_strategy(strategy_id, df, additional_data)
@@ -660,489 +927,68 @@ class TradingEngine:
                         strategy_id=strategy_id,
                         entry_price=signal.price,
                         quantity=signal.suggested_amount / signal.price,
-                        side='long'
+                        side=SIDE_LONG
                     )
             
             return signal
             
-            # EnhancedSignal을 TradingSignal로 변환
-            if enhanced_signal:
-                return TradingSignal(
-                    strategy_id=strategy_id,
-                    action=enhanced_signal.direction if enhanced_signal.direction != 'neutral' else 'hold',
-                    confidence=enhanced_signal.confidence,
-                    price=enhanced_signal.entry_price,
-                    suggested_amount=enhanced_signal.position_size,
-                    reasoning=enhanced_signal.reason,
-                    timestamp=datetime.now(),
-                    timeframe=strategy.get('timeframe', '1h')
-                )
-            
-            # 기존 간단한 전략들도 여전히 사용
-            market_data = self.api.get_market_data("KRW-BTC")
-            if not market_data:
-                return None
-            
-            if strategy_id == "h4":  # VWAP 되돌림 전략
-                return self._vwap_signal(market_data, strategy)
-            
-            # 기본 홀드 신호
-            return TradingSignal(
-                strategy_id=strategy_id,
-                action='hold',
-                confidence=0.5,
-                price=market_data.price if market_data else 0,
-                suggested_amount=0,
-                reasoning="신호 없음",
-                timestamp=datetime.now(),
-                timeframe=strategy.get('timeframe', '1h')
-            )
-            
         except Exception as e:
             self.logger.error(f"신호 생성 오류 {strategy_id}: {e}")
             return None
 
-    def _ema_cross_signal(self, market_data: MarketData, strategy: Dict) -> TradingSignal:
-        """EMA 크로스 신호 생성 - 실제 데이터 기반"""
-        try:
-            # 실제 캔들 데이터 가져오기
-            df = self._get_market_dataframe("KRW-BTC", period=50)
-            if df is None or len(df) < 26:
-                return self._default_hold_signal("h1", market_data.price, "데이터 부족")
-            
-            # EMA 계산
-            df['ema12'] = talib.EMA(df['close'].values, timeperiod=12)
-            df['ema26'] = talib.EMA(df['close'].values, timeperiod=26)
-            
-            # 현재와 이전 값
-            current_ema12 = df['ema12'].iloc[-1]
-            current_ema26 = df['ema26'].iloc[-1]
-            prev_ema12 = df['ema12'].iloc[-2]
-            prev_ema26 = df['ema26'].iloc[-2]
-            
-            # 골든크로스/데드크로스 체크
-            if prev_ema12 <= prev_ema26 and current_ema12 > current_ema26:
-                # 골든크로스 - 매수 신호
-                # 설정 기반 거래 금액 계산
-                max_trade_amount = self.config.get_trading_config().get('max_trade_amount', 100000)
-                suggested_amount = max_trade_amount * 0.5  # 최대 금액의 50%
-                
-                return TradingSignal(
-                    strategy_id="h1",
-                    action='buy',
-                    confidence=0.7,
-                    price=market_data.price,
-                    suggested_amount=int(suggested_amount),
-                    reasoning=f"EMA 골든크로스 (12: {current_ema12:,.0f}, 26: {current_ema26:,.0f})",
-                    timestamp=datetime.now(),
-                    timeframe="1h"
-                )
-            elif prev_ema12 >= prev_ema26 and current_ema12 < current_ema26:
-                # 데드크로스 - 매도 신호
-                return TradingSignal(
-                    strategy_id="h1",
-                    action='sell',
-                    confidence=0.6,
-                    price=market_data.price,
-                    suggested_amount=0,
-                    reasoning=f"EMA 데드크로스 (12: {current_ema12:,.0f}, 26: {current_ema26:,.0f})",
-                    timestamp=datetime.now(),
-                    timeframe="1h"
-                )
-            
-            # 추세 방향에 따른 약한 신호
-            if current_ema12 > current_ema26:
-                confidence = min(0.5 + abs(current_ema12 - current_ema26) / market_data.price * 10, 0.65)
-                return TradingSignal(
-                    strategy_id="h1",
-                    action='hold',
-                    confidence=confidence,
-                    price=market_data.price,
-                    suggested_amount=0,
-                    reasoning=f"상승 추세 유지 (EMA12 > EMA26)",
-                    timestamp=datetime.now(),
-                    timeframe="1h"
-                )
-            
-            return self._default_hold_signal("h1", market_data.price, "EMA 크로스 신호 없음")
-            
-        except Exception as e:
-            self.logger.error(f"EMA 신호 생성 오류: {e}")
-            return self._default_hold_signal("h1", market_data.price, f"오류: {e}")
-    
-    def _default_hold_signal(self, strategy_id: str, price: float, reason: str) -> TradingSignal:
-        """기본 홀드 신호"""
-        return TradingSignal(
-            strategy_id=strategy_id,
-            action='hold',
-            confidence=0.5,
-            price=price,
-            suggested_amount=0,
-            reasoning=reason,
-            timestamp=datetime.now(),
-            timeframe="1h"
-        )
+    def _d1_additional_data(self) -> Dict:
+        """D1 전략용 주봉 데이터"""
+        return {'weekly_df': self._get_historical_dataframe(SYM_KRWBTC, "weekly")}
 
-    def _rsi_divergence_signal(self, df: pd.DataFrame, strategy: Dict) -> TradingSignal:
-        """RSI 다이버전스 신호 생성"""
-        try:
-            if len(df) < 30:
-                return self._default_hold_signal("h2", df['close'].iloc[-1], "데이터 부족")
-            
-            # RSI 계산
-            rsi = talib.RSI(df['close'].values, timeperiod=14)
-            current_price = df['close'].iloc[-1]
-            
-            # 최근 20봉에서 고점/저점 찾기
-            recent_high_idx = df['high'].iloc[-20:].idxmax()
-            recent_low_idx = df['low'].iloc[-20:].idxmin()
-            
-            # RSI 다이버전스 체크
-            if rsi[-1] < 30:  # 과매도 구간
-                # 가격은 더 낮은데 RSI는 더 높으면 상승 다이버전스
-                if df['low'].iloc[-1] < df['low'].iloc[-10] and rsi[-1] > rsi[-10]:
-                    # 설정 기반 거래 금액 계산
-                    max_trade_amount = self.config.get_trading_config().get('max_trade_amount', 100000)
-                    suggested_amount = max_trade_amount * 0.4  # 최대 금액의 40%
-                    
-                    return TradingSignal(
-                        strategy_id="h2",
-                        action='buy',
-                        confidence=0.65,
-                        price=current_price,
-                        suggested_amount=int(suggested_amount),
-                        reasoning=f"RSI 상승 다이버전스 (RSI: {rsi[-1]:.1f})",
-                        timestamp=datetime.now(),
-                        timeframe="1h"
-                    )
-            elif rsi[-1] > 70:  # 과매수 구간
-                # 가격은 더 높은데 RSI는 더 낮으면 하락 다이버전스
-                if df['high'].iloc[-1] > df['high'].iloc[-10] and rsi[-1] < rsi[-10]:
-                    return TradingSignal(
-                        strategy_id="h2",
-                        action='sell',
-                        confidence=0.6,
-                        price=current_price,
-                        suggested_amount=0,
-                        reasoning=f"RSI 하락 다이버전스 (RSI: {rsi[-1]:.1f})",
-                        timestamp=datetime.now(),
-                        timeframe="1h"
-                    )
-            
-            return self._default_hold_signal("h2", current_price, f"RSI: {rsi[-1]:.1f} - 신호 없음")
-            
-        except Exception as e:
-            self.logger.error(f"RSI 신호 생성 오류: {e}")
-            return self._default_hold_signal("h2", df['close'].iloc[-1], f"오류: {e}")
-    
-    def _macd_signal(self, df: pd.DataFrame, strategy: Dict) -> TradingSignal:
-        """MACD 신호 생성"""
-        try:
-            if len(df) < 35:
-                return self._default_hold_signal("h5", df['close'].iloc[-1], "데이터 부족")
-            
-            # MACD 계산
-            macd, macdsignal, macdhist = talib.MACD(df['close'].values, 
-                                                    fastperiod=12, 
-                                                    slowperiod=26, 
-                                                    signalperiod=9)
-            
-            current_price = df['close'].iloc[-1]
-            
-            # MACD 히스토그램 0선 교차
-            if macdhist[-2] < 0 and macdhist[-1] > 0:
-                # 매수 신호
-                # 설정 기반 거래 금액 계산
-                max_trade_amount = self.config.get_trading_config().get('max_trade_amount', 100000)
-                suggested_amount = max_trade_amount * 0.45  # 최대 금액의 45%
-                
-                return TradingSignal(
-                    strategy_id="h5",
-                    action='buy',
-                    confidence=0.65,
-                    price=current_price,
-                    suggested_amount=int(suggested_amount),
-                    reasoning=f"MACD 골든크로스 (Hist: {macdhist[-1]:.0f})",
-                    timestamp=datetime.now(),
-                    timeframe="1h"
-                )
-            elif macdhist[-2] > 0 and macdhist[-1] < 0:
-                # 매도 신호
-                return TradingSignal(
-                    strategy_id="h5",
-                    action='sell',
-                    confidence=0.6,
-                    price=current_price,
-                    suggested_amount=0,
-                    reasoning=f"MACD 데드크로스 (Hist: {macdhist[-1]:.0f})",
-                    timestamp=datetime.now(),
-                    timeframe="1h"
-                )
-            
-            return self._default_hold_signal("h5", current_price, f"MACD Hist: {macdhist[-1]:.0f}")
-            
-        except Exception as e:
-            self.logger.error(f"MACD 신호 생성 오류: {e}")
-            return self._default_hold_signal("h5", df['close'].iloc[-1], f"오류: {e}")
-    
-    def _pivot_point_signal(self, df: pd.DataFrame, strategy: Dict) -> TradingSignal:
-        """피봇 포인트 신호 생성"""
-        try:
-            if len(df) < 2:
-                return self._default_hold_signal("h3", df['close'].iloc[-1], "데이터 부족")
-            
-            # 전일 데이터로 피봇 포인트 계산
-            prev_high = df['high'].iloc[-2]
-            prev_low = df['low'].iloc[-2]
-            prev_close = df['close'].iloc[-2]
-            current_price = df['close'].iloc[-1]
-            
-            # 피봇 포인트 계산
-            pivot = (prev_high + prev_low + prev_close) / 3
-            r1 = 2 * pivot - prev_low
-            r2 = pivot + (prev_high - prev_low)
-            s1 = 2 * pivot - prev_high
-            s2 = pivot - (prev_high - prev_low)
-            
-            # 지지/저항 근처에서 반등 신호
-            # 설정 기반 임계값
-            poc_threshold = self.config.get_risk_management_config().get('volume_profile', {}).get('poc_distance_threshold', 0.02)
-            pivot_threshold = poc_threshold / 4  # 피봇 포인트는 더 타이트한 임계값 사용
-            
-            if abs(current_price - s1) / current_price < pivot_threshold:  # S1 근처
-                # 설정 기반 거래 금액 계산
-                max_trade_amount = self.config.get_trading_config().get('max_trade_amount', 100000)
-                suggested_amount = max_trade_amount * 0.35  # 최대 금액의 35%
-                
-                return TradingSignal(
-                    strategy_id="h3",
-                    action='buy',
-                    confidence=0.6,
-                    price=current_price,
-                    suggested_amount=int(suggested_amount),
-                    reasoning=f"S1 지지선 반등 (S1: {s1:,.0f})",
-                    timestamp=datetime.now(),
-                    timeframe="1h"
-                )
-            elif abs(current_price - r1) / current_price < pivot_threshold:  # R1 근처
-                return TradingSignal(
-                    strategy_id="h3",
-                    action='sell',
-                    confidence=0.55,
-                    price=current_price,
-                    suggested_amount=0,
-                    reasoning=f"R1 저항선 도달 (R1: {r1:,.0f})",
-                    timestamp=datetime.now(),
-                    timeframe="1h"
-                )
-            
-            return self._default_hold_signal("h3", current_price, 
-                                            f"PP: {pivot:,.0f}, S1: {s1:,.0f}, R1: {r1:,.0f}")
-            
-        except Exception as e:
-            self.logger.error(f"피봇 포인트 신호 생성 오류: {e}")
-            return self._default_hold_signal("h3", df['close'].iloc[-1], f"오류: {e}")
-    
-    def _vwap_signal(self, market_data: MarketData, strategy: Dict) -> TradingSignal:
-        """VWAP 신호 생성"""
-        try:
-            df = self._get_market_dataframe("KRW-BTC", period=30)
-            if df is None or len(df) < 10:
-                return self._default_hold_signal("h4", market_data.price, "데이터 부족")
-            
-            # VWAP 계산
-            typical_price = (df['high'] + df['low'] + df['close']) / 3
-            vwap = (typical_price * df['volume']).cumsum() / df['volume'].cumsum()
-            current_vwap = vwap.iloc[-1]
-            current_price = df['close'].iloc[-1]
-            
-            # 가격과 VWAP 관계
-            distance = (current_price - current_vwap) / current_vwap
-            
-            if distance < -0.01:  # VWAP 아래 1%
-                return TradingSignal(
-                    strategy_id="h4",
-                    action='buy',
-                    confidence=0.6,
-                    price=current_price,
-                    suggested_amount=int(self.config.get_trading_config().get('max_trade_amount', 100000) * 0.35),
-                    reasoning=f"VWAP 하단 매수 기회 (VWAP: {current_vwap:,.0f})",
-                    timestamp=datetime.now(),
-                    timeframe="1h"
-                )
-            elif distance > 0.015:  # VWAP 위 1.5%
-                return TradingSignal(
-                    strategy_id="h4",
-                    action='sell',
-                    confidence=0.55,
-                    price=current_price,
-                    suggested_amount=0,
-                    reasoning=f"VWAP 상단 매도 신호 (VWAP: {current_vwap:,.0f})",
-                    timestamp=datetime.now(),
-                    timeframe="1h"
-                )
-            
-            return self._default_hold_signal("h4", current_price, 
-                                            f"VWAP: {current_vwap:,.0f}, 거리: {distance:.1%}")
-            
-        except Exception as e:
-            self.logger.error(f"VWAP 신호 생성 오류: {e}")
-            return self._default_hold_signal("h4", market_data.price, f"오류: {e}")
-    
-    def _open_interest_signal(self, df: pd.DataFrame, strategy: Dict) -> TradingSignal:
-        """미체결 약정 신호 (간단 구현)"""
-        try:
-            current_price = df['close'].iloc[-1]
-            # OI 데이터는 실제로 별도 API가 필요함
-            # 여기서는 거래량 기반 간단 시뮬레이션
-            volume_ma = df['volume'].rolling(20).mean().iloc[-1]
-            current_volume = df['volume'].iloc[-1]
-            
-            if current_volume > volume_ma * 2:
-                if df['close'].iloc[-1] > df['close'].iloc[-2]:
-                    return TradingSignal(
-                        strategy_id="h7",
-                        action='buy',
-                        confidence=0.6,
-                        price=current_price,
-                        suggested_amount=int(self.config.get_trading_config().get('max_trade_amount', 100000) * 0.3),
-                        reasoning=f"거래량 급증 + 가격 상승",
-                        timestamp=datetime.now(),
-                        timeframe="1h"
-                    )
-            
-            return self._default_hold_signal("h7", current_price, "OI 신호 없음")
-        except Exception as e:
-            return self._default_hold_signal("h7", df['close'].iloc[-1], f"오류: {e}")
-    
-    def _flag_pattern_signal(self, df: pd.DataFrame, strategy: Dict) -> TradingSignal:
-        """깃발 패턴 신호 (간단 구현)"""
-        try:
-            current_price = df['close'].iloc[-1]
-            # 실제로는 복잡한 패턴 인식 필요
-            # 여기서는 간단한 추세 지속 패턴
-            
-            if len(df) < 20:
-                return self._default_hold_signal("h8", current_price, "데이터 부족")
-            
-            # 최근 20봉 추세
-            trend = (df['close'].iloc[-1] - df['close'].iloc[-20]) / df['close'].iloc[-20]
-            
-            # 최근 5봉 횡보
-            recent_range = (df['high'].iloc[-5:].max() - df['low'].iloc[-5:].min()) / df['close'].iloc[-5].mean()
-            
-            if trend > 0.05 and recent_range < 0.02:  # 상승 추세 후 횡보
-                return TradingSignal(
-                    strategy_id="h8",
-                    action='buy',
-                    confidence=0.58,
-                    price=current_price,
-                    suggested_amount=int(self.config.get_trading_config().get('max_trade_amount', 100000) * 0.25),
-                    reasoning="상승 깃발 패턴",
-                    timestamp=datetime.now(),
-                    timeframe="1h"
-                )
-            
-            return self._default_hold_signal("h8", current_price, "패턴 미형성")
-        except Exception as e:
-            return self._default_hold_signal("h8", df['close'].iloc[-1], f"오류: {e}")
-    
-    def _daily_strategy_signal(self, strategy_id: str, strategy: Dict) -> TradingSignal:
-        """일봉 전략 신호 (통합 간단 구현)"""
-        try:
-            # 일봉 데이터 가져오기
-            df = self._get_daily_dataframe("KRW-BTC", period=50)
-            if df is None or len(df) < 20:
-                return self._default_hold_signal(strategy_id, 0, "일봉 데이터 부족")
-            
-            current_price = df['close'].iloc[-1]
-            
-            if strategy_id == "d1":  # 주봉 필터링 + 50일선
-                sma50 = talib.SMA(df['close'].values, timeperiod=min(50, len(df)-1))
-                if sma50[-1] > 0 and abs(current_price - sma50[-1]) / sma50[-1] < 0.01:
-                    return TradingSignal(
-                        strategy_id="d1",
-                        action='buy',
-                        confidence=0.62,
-                        price=current_price,
-                        suggested_amount=int(self.config.get_trading_config().get('max_trade_amount', 100000) * 0.6),
-                        reasoning=f"50일선 지지 (SMA50: {sma50[-1]:,.0f})",
-                        timestamp=datetime.now(),
-                        timeframe="1d"
-                    )
-            
-            elif strategy_id == "d4":  # 공포탐욕 RSI
-                rsi = talib.RSI(df['close'].values, timeperiod=14)
-                if rsi[-1] < 30:
-                    return TradingSignal(
-                        strategy_id="d4",
-                        action='buy',
-                        confidence=0.61,
-                        price=current_price,
-                        suggested_amount=int(self.config.get_trading_config().get('max_trade_amount', 100000) * 0.4),
-                        reasoning=f"극도의 공포 구간 (RSI: {rsi[-1]:.1f})",
-                        timestamp=datetime.now(),
-                        timeframe="1d"
-                    )
-                elif rsi[-1] > 70:
-                    return TradingSignal(
-                        strategy_id="d4",
-                        action='sell',
-                        confidence=0.58,
-                        price=current_price,
-                        suggested_amount=0,
-                        reasoning=f"극도의 탐욕 구간 (RSI: {rsi[-1]:.1f})",
-                        timestamp=datetime.now(),
-                        timeframe="1d"
-                    )
-            
-            return self._default_hold_signal(strategy_id, current_price, "일봉 신호 없음")
-            
-        except Exception as e:
-            self.logger.error(f"일봉 전략 신호 생성 오류: {e}")
-            return self._default_hold_signal(strategy_id, 0, f"오류: {e}")
-    
-    def _get_daily_dataframe(self, symbol: str, period: int = 50) -> Optional[pd.DataFrame]:
-        """일봉 데이터 가져오기"""
-        try:
-            # 일봉 데이터는 1440분으로 요청
-            candles = self.api.get_candles(market=symbol, minutes=1440, count=period)
-            
-            if not candles or len(candles) < 10:
-                return None
-            
-            df = pd.DataFrame(candles)
-            df = df.rename(columns={
-                'opening_price': 'open',
-                'high_price': 'high', 
-                'low_price': 'low',
-                'trade_price': 'close',
-                'candle_acc_trade_volume': 'volume'
-            })
-            
-            df = df[['open', 'high', 'low', 'close', 'volume']]
+    def _key_lock(self, key: tuple) -> threading.Lock:
+        """데이터 키별 락 반환 (없으면 생성)"""
+        with self._data_lock:
+            lock = self._data_locks.get(key)
+            if lock is None:
+                lock = self._data_locks[key] = threading.Lock()
+            return lock
+
+    def _cached_market_frame(self, symbol: str, period: int, minutes: int,
+                             loader) -> Optional[pd.DataFrame]:
+        """짧은 TTL 동안 같은 캔들 조회 결과를 재사용 (전략은 읽기만 해야 함)"""
+        key = (symbol, period, minutes)
+        # 같은 키를 조회 중인 워커는 첫 조회가 끝나면 그 결과를 재사용
+        with self._key_lock(('market',) + key):
+            now = time.monotonic()
+            entry = self._market_frames.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            
+            df = loader(symbol, period)
+            if df is not None:
+                ttl = min(self.MARKET_DATA_TTL, minutes * 60)
+                self._market_frames[key] = (now + ttl, df)
             return df
-            
-        except Exception as e:
-            self.logger.error(f"일봉 데이터 가져오기 오류: {e}")
-            return None
-    
+
     def _get_historical_dataframe(self, symbol: str, strategy_id: str) -> Optional[pd.DataFrame]:
         """히스토리컬 데이터를 DataFrame으로 가져오기 - 데이터베이스 우선"""
+        # 전략별 적절한 timeframe 설정
+        if strategy_id.startswith('h'):  # 시간봉 전략
+            timeframe, days_back = "60", 30  # 1시간
+        elif strategy_id.startswith('d'):  # 일봉 전략
+            timeframe, days_back = "1440", 200  # 1일
+        elif strategy_id == "weekly":  # 주봉 데이터 요청
+            timeframe, days_back = "10080", 365  # 1주
+        else:
+            timeframe, days_back = "60", 30
+        
+        # 같은 타임프레임을 요청한 전략들만 기다려 한 번 조회한 데이터를 공유
+        with self._key_lock(('historical', symbol, timeframe)):
+            return self._load_historical_dataframe(symbol, strategy_id, timeframe, days_back)
+
+    def _load_historical_dataframe(self, symbol: str, strategy_id: str,
+                                   timeframe: str, days_back: int) -> Optional[pd.DataFrame]:
+        """히스토리컬 데이터 조회 및 링 버퍼 갱신"""
         try:
-            # 전략별 적절한 timeframe 설정
-            if strategy_id.startswith('h'):  # 시간봉 전략
-                timeframe = "60"  # 1시간
-                days_back = 30
-            elif strategy_id.startswith('d'):  # 일봉 전략
-                timeframe = "1440"  # 1일
-                days_back = 200
-            elif strategy_id == "weekly":  # 주봉 데이터 요청
-                timeframe = "10080"  # 1주
-                days_back = 365
-            else:
-                timeframe = "60"
-                days_back = 30
+            # 이번 신호 수집 주기에 이미 조회한 데이터면 재사용
+            cache_key = (symbol, timeframe)
+            if self._cycle_frames is not None and cache_key in self._cycle_frames:
+                return self._cycle_frames[cache_key]
             
             # 데이터베이스에서 먼저 조회
             end_date = datetime.now()
@@ -1157,7 +1003,7 @@ class TradingEngine:
             
             # 데이터가 부족하면 API에서 수집
             if df is None or len(df) < 50:
-                self.logger.info(f"데이터베이스 데이터 부족, API에서 수집 중...")
+                self.logger.info("데이터베이스 데이터 부족, API에서 수집 중...")
                 df = self.data_collector.collect_historical_candles(
                     market=symbol,
                     timeframe=timeframe,
@@ -1169,7 +1015,19 @@ class TradingEngine:
                 if 'timestamp' in df.columns and not isinstance(df.index, pd.DatetimeIndex):
                     df.set_index('timestamp', inplace=True)
                 
-                self.logger.info(f"히스토리컬 데이터 {len(df)}개 로드 완료 (전략: {strategy_id})")
+                self.logger.info("히스토리컬 데이터 %d개 로드 완료 (전략: %s)", len(df), strategy_id)
+                
+                # 링 버퍼에 새 캔들만 누적하고 전략에는 버퍼와 메모리를 공유하지 않는 복사본을 전달
+                # (_cycle_frames에 담긴 프레임이 다음 extend로 바뀌지 않도록)
+                if isinstance(df.index, pd.DatetimeIndex) and set(OHLCV_COLUMNS).issubset(df.columns):
+                    ring = self._ohlcv_rings.get(cache_key)
+                    if ring is None:
+                        ring = self._ohlcv_rings[cache_key] = OHLCVRingBuffer()
+                    ring.extend(df.sort_index())
+                    df = ring.to_dataframe(len(df))
+            
+            if self._cycle_frames is not None:
+                self._cycle_frames[cache_key] = df
             
             return df
             
@@ -1179,36 +1037,20 @@ class TradingEngine:
     
     def _get_market_dataframe(self, symbol: str, period: int = 100) -> Optional[pd.DataFrame]:
         """시장 데이터를 DataFrame으로 가져오기 - 실제 캔들 데이터 사용"""
+        return self._cached_market_frame(symbol, period, 60, self._load_market_dataframe)
+
+    def _load_market_dataframe(self, symbol: str, period: int) -> Optional[pd.DataFrame]:
+        """시간봉 캔들 API 조회"""
         try:
             # Upbit API에서 실제 캔들 데이터 가져오기
             # 시간봉 데이터 사용 (60분)
-            candles = self.api.get_candles(market=symbol, minutes=60, count=period)
+            df = self._load_candle_frame(symbol, period, 60)
             
-            if not candles or len(candles) < 20:  # 최소 20개 이상의 데이터 필요
-                self.logger.warning(f"캔들 데이터 부족: {len(candles) if candles else 0}개")
+            if df is None or len(df) < 20:  # 최소 20개 이상의 데이터 필요
+                self.logger.warning("캔들 데이터 부족: %d개", len(df) if df is not None else 0)
                 return None
             
-            # DataFrame 생성
-            df = pd.DataFrame(candles)
-            
-            # 컬럼명 변경 (Upbit API 응답 형식에 맞춤)
-            df = df.rename(columns={
-                'opening_price': 'open',
-                'high_price': 'high',
-                'low_price': 'low',
-                'trade_price': 'close',
-                'candle_acc_trade_volume': 'volume'
-            })
-            
-            # 필요한 컬럼만 선택
-            df = df[['open', 'high', 'low', 'close', 'volume']]
-            
-            # 인덱스를 시간으로 설정 (선택사항)
-            if 'candle_date_time_kst' in candles[0]:
-                df['timestamp'] = pd.to_datetime([c['candle_date_time_kst'] for c in candles])
-                df.set_index('timestamp', inplace=True)
-            
-            self.logger.info(f"실제 캔들 데이터 {len(df)}개 로드 완료")
+            self.logger.info("실제 캔들 데이터 %d개 로드 완료", len(df))
             
             return df
             
@@ -1216,19 +1058,74 @@ class TradingEngine:
             self.logger.error(f"시장 데이터 DataFrame 생성 오류: {e}")
             return None
 
+    def _load_candle_frame(self, symbol: str, period: int, minutes: int) -> Optional[pd.DataFrame]:
+        """캔들 링 버퍼를 갱신하고 최근 period개 반환
+        
+        버퍼에 period개 이상 쌓여 있으면 최신 2개 캔들만 조회해 이어 붙이고,
+        처음이거나 조회 공백이 생긴 경우에만 period개 전체를 다시 조회한다.
+        """
+        key = (symbol, minutes)
+        ring = self._candle_rings.get(key)
+        if ring is not None and len(ring) >= period:
+            candles = self.api.get_candles(market=symbol, minutes=minutes, count=2)
+            if not candles:
+                return None
+            latest = self._candles_to_dataframe(candles)
+            if (isinstance(latest.index, pd.DatetimeIndex)
+                    and latest.index.values[0] <= ring.last_timestamp):
+                ring.extend(latest)
+                return ring.to_dataframe(period)
+        
+        candles = self.api.get_candles(market=symbol, minutes=minutes, count=period)
+        if not candles:
+            return None
+        
+        df = self._candles_to_dataframe(candles)
+        if not isinstance(df.index, pd.DatetimeIndex):
+            return df
+        
+        if ring is None:
+            ring = self._candle_rings[key] = OHLCVRingBuffer()
+        ring.clear()
+        ring.extend(df)
+        return ring.to_dataframe(len(df))
+
+    def _candles_to_dataframe(self, candles: List[Dict]) -> pd.DataFrame:
+        """Upbit 캔들 응답을 OHLCV DataFrame으로 변환
+        
+        dict 목록으로 DataFrame을 만든 뒤 이름 변경/컬럼 선택을 거치지 않고,
+        필요한 필드만 float64 배열 하나에 채워 그대로 감싼다.
+        """
+        values = np.fromiter(
+            (candle[field] for candle in candles for field in _CANDLE_FIELDS),
+            dtype=np.float64, count=len(candles) * len(_CANDLE_FIELDS)
+        ).reshape(len(candles), len(_CANDLE_FIELDS))
+        
+        # 인덱스를 시간으로 설정 (선택사항)
+        index = None
+        if 'candle_date_time_kst' in candles[0]:
+            # ISO 형식 문자열을 datetime64로 바로 변환 (중간 리스트/형식 추론 없음)
+            index = pd.DatetimeIndex(
+                np.fromiter((c['candle_date_time_kst'] for c in candles),
+                            dtype='datetime64[ns]', count=len(candles)),
+                name='timestamp'
+            )
+        
+        return pd.DataFrame(values, columns=OHLCV_COLUMNS, index=index, copy=False)
+
     def process_signal(self, signal: TradingSignal):
         """거래 신호 처리"""
         try:
             # 리스크 관리 체크
             can_trade, reason = self.risk_manager.can_trade()
             if not can_trade:
-                self.logger.warning(f"거래 불가: {reason}")
+                self.logger.warning("거래 불가: %s", reason)
                 return
             
             # 신호 강도 체크
-            min_confidence = self.config.get_config('strategies.min_signal_strength')
+            min_confidence = self._cached_settings.min_confidence
             if signal.confidence < min_confidence:
-                self.logger.info(f"신호 강도 부족: {signal.confidence} < {min_confidence}")
+                self.logger.info("신호 강도 부족: %s < %s", signal.confidence, min_confidence)
                 return
             
             if signal.action == 'buy':
@@ -1242,7 +1139,7 @@ class TradingEngine:
     def execute_buy_order(self, signal: TradingSignal):
         """매수 주문 실행"""
         try:
-            balance = self.api.get_balance("KRW")
+            balance = self.api.get_balance(SYM_KRW)
             if balance < 10000:
                 self.logger.warning("매수할 원화 잔고 부족")
                 return
@@ -1251,31 +1148,34 @@ class TradingEngine:
             position_size = self.risk_manager.calculate_position_size(signal, balance)
             
             # 주문 실행
-            result = self.api.place_buy_order("KRW-BTC", signal.price, amount=position_size)
+            result = self.api.place_buy_order(SYM_KRWBTC, signal.price, amount=position_size)
             
             if result.success:
-                self.logger.info(f"매수 주문 성공: {result.order_id} - {position_size:,.0f}원")
+                self.logger.info("매수 주문 성공: %s - %.0f원", result.order_id, position_size)
+                now = datetime.now()
                 
                 # 거래 기록 추가
                 trade_record = TradeRecord(
                     strategy_id=signal.strategy_id,
-                    entry_time=datetime.now(),
+                    entry_time=now,
                     exit_time=None,
                     entry_price=signal.price,
                     exit_price=None,
                     position_size=position_size / signal.price,
-                    side='long',
+                    side=SIDE_LONG,
                     pnl=None,
-                    fees=position_size * 0.0005,  # 0.05% 수수료
+                    fees=position_size * FEE_RATE,
                     status='open'
                 )
                 
                 self.strategy_manager.add_trade_record(trade_record)
-                self.pending_orders[result.order_id] = {
+                self._new_orders.append((result.order_id, {
                     'trade_record': trade_record,
                     'signal': signal,
-                    'timestamp': datetime.now()
-                }
+                    'timestamp': now,
+                    # 타임아웃 판정용 (시스템 시계 변경 영향 없음)
+                    'submitted': time.monotonic()
+                }))
                 
             else:
                 self.logger.error(f"매수 주문 실패: {result.message}")
@@ -1291,7 +1191,7 @@ class TradingEngine:
             available_btc = 0
             if accounts:
                 for account in accounts:
-                    if account['currency'] == 'BTC':
+                    if account['currency'] == SYM_BTC:
                         available_btc = float(account['balance'])
                         break
             
@@ -1302,17 +1202,17 @@ class TradingEngine:
             # 최소 주문 수량 확인 (Upbit 최소 주문: 0.0001 BTC)
             min_btc_volume = 0.0001
             if available_btc < min_btc_volume:
-                self.logger.warning(f"보유 BTC({available_btc:.8f})가 최소 주문 수량({min_btc_volume})보다 작습니다")
+                self.logger.warning("보유 BTC(%.8f)가 최소 주문 수량(%s)보다 작습니다", available_btc, min_btc_volume)
                 return
             
             # 시장가 매도 (수량 기준)
             sell_volume = available_btc
-            self.logger.info(f"자동거래 매도: {sell_volume:.8f} BTC")
+            self.logger.info("자동거래 매도: %.8f BTC", sell_volume)
             
-            result = self.api.place_sell_order("KRW-BTC", signal.price, sell_volume)
+            result = self.api.place_sell_order(SYM_KRWBTC, signal.price, sell_volume)
             
             if result.success:
-                self.logger.info(f"매도 주문 성공: {result.order_id} - {sell_volume:.8f}BTC")
+                self.logger.info("매도 주문 성공: %s - %.8fBTC", result.order_id, sell_volume)
                 
             else:
                 self.logger.error(f"매도 주문 실패: {result.message}")
@@ -1320,30 +1220,48 @@ class TradingEngine:
         except Exception as e:
             self.logger.error(f"매도 주문 실행 오류: {e}")
 
+    def _drain_new_orders(self):
+        """신규 주문 큐를 미체결 주문 목록으로 이동"""
+        with self._order_lock:
+            while True:
+                try:
+                    order_id, order_info = self._new_orders.popleft()
+                except IndexError:
+                    break
+                self.pending_orders[order_id] = order_info
+                heapq.heappush(self._order_expiry, (order_info['submitted'], order_id))
+
     def monitor_positions(self):
         """포지션 모니터링 - 통합 관리"""
         try:
+            # 현재가와 미체결 주문 상태를 동시에 조회 (주문 상태는 uuid 목록 요청 한 번)
+            self._drain_new_orders()
+            order_ids = list(self.pending_orders)
+            price_future = self._api_pool.submit(self.api.get_current_price, SYM_KRWBTC)
+            order_statuses = self.api.get_orders_status(order_ids) if order_ids else {}
+            
             # 1. 미체결 주문 확인
-            for order_id, order_info in list(self.pending_orders.items()):
-                order_status = self.api.get_order_status(order_id)
-                if order_status and order_status.get('state') == 'done':
-                    self.logger.info(f"주문 체결 완료: {order_id}")
-                    del self.pending_orders[order_id]
+            for order_id, order_status in order_statuses.items():
+                if order_status.get('state') == 'done':
+                    self.logger.info("주문 체결 완료: %s", order_id)
+                    self.pending_orders.pop(order_id, None)
             
             # 2. 현재가 업데이트
-            current_price = self.api.get_current_price("KRW-BTC")
+            current_price = price_future.result()
             if current_price:
-                current_prices = {"KRW-BTC": current_price}
-                self.position_manager.update_positions(current_prices)
+                current_prices = {SYM_KRWBTC: current_price}
+                with self._position_lock:
+                    self.position_manager.update_positions(current_prices)
             
             # 3. 포지션 요약 정보 로깅 (주기적)
-            if datetime.now().minute % 10 == 0:  # 10분마다
+            now = time.monotonic()
+            if now - self._last_summary_log >= self.POSITION_SUMMARY_INTERVAL:  # 10분마다
+                self._last_summary_log = now
                 summary = self.position_manager.get_position_summary()
                 self.logger.info(
-                    f"포지션 요약: {summary.total_positions}개 포지션, "
-                    f"총노출: {summary.total_exposure:,.0f}, "
-                    f"미실현손익: {summary.unrealized_pnl:+,.0f}, "
-                    f"리스크레벨: {summary.risk_level}"
+                    "포지션 요약: %d개 포지션, 총노출: %.0f, 미실현손익: %+.0f, 리스크레벨: %s",
+                    summary.total_positions, summary.total_exposure,
+                    summary.unrealized_pnl, summary.risk_level
                 )
             
         except Exception as e:
@@ -1352,14 +1270,23 @@ class TradingEngine:
     def process_pending_orders(self):
         """미체결 주문 처리"""
         # 타임아웃된 주문 취소 등의 로직
-        timeout_minutes = self.config.get_config('strategies.signal_timeout_minutes')
-        cutoff_time = datetime.now() - timedelta(minutes=timeout_minutes)
+        timeout_minutes = self._cached_settings.signal_timeout
+        cutoff_time = time.monotonic() - timeout_minutes * 60
         
-        for order_id, order_info in list(self.pending_orders.items()):
-            if order_info['timestamp'] < cutoff_time:
-                self.logger.info(f"주문 타임아웃으로 취소: {order_id}")
-                self.api.cancel_order(order_id)
-                del self.pending_orders[order_id]
+        self._drain_new_orders()
+        
+        # 가장 오래된 주문부터 꺼내 기준 시각 이전인 것만 처리
+        expired = []
+        with self._order_lock:
+            heap = self._order_expiry
+            while heap and heap[0][0] < cutoff_time:
+                _, order_id = heapq.heappop(heap)
+                if self.pending_orders.pop(order_id, None) is not None:
+                    expired.append(order_id)
+        
+        for order_id in expired:
+            self.logger.info("주문 타임아웃으로 취소: %s", order_id)
+            self.api.cancel_order(order_id)
 
 # 실행 함수
 def main():
@@ -1369,7 +1296,10 @@ def main():
     
     try:
         engine = TradingEngine()
-        engine.start()
+        try:
+            engine.start()
+        finally:
+            engine.close()
     except KeyboardInterrupt:
         print("\n시스템 종료 중...")
     except Exception as e:
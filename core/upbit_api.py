@@ -4,17 +4,29 @@ Upbit API 래퍼 클래스
 """
 
 import os
-import jwt
+import json
+import hmac
+import base64
 import uuid
 import hashlib
 import requests
+import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 from typing import Dict, List, Optional, Any, Tuple
 from urllib.parse import urlencode
 import logging
+import logging.handlers
 from datetime import datetime
 from dataclasses import dataclass
 import threading
+import queue
+import atexit
+from decimal import Decimal, ROUND_DOWN
+from functools import lru_cache
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 
 # .env 파일 로드
 try:
@@ -23,6 +35,45 @@ try:
 except ImportError:
     pass
 
+# 응답 JSON 파싱 (orjson 설치 시 사용, 없으면 표준 json)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# 주문 수량 최소 단위 (소수점 8자리)
+_VOLUME_STEP = Decimal('0.00000001')
+
+# 호가 단위 구간 (가격이 _TICK_BOUNDS[i] 이상이면 _TICK_STEPS[i + 1])
+_TICK_BOUNDS = (10_000, 100_000, 1_000_000, 2_000_000)
+_TICK_STEPS = (10, 50, 100, 500, 1000)
+_TICK_STEP_ARRAY = np.array(_TICK_STEPS, dtype=np.float64)
+
+# 캔들 구조화 배열 형식 (시각 + OHLCV, 캔들당 48바이트)
+CANDLE_DTYPE = np.dtype([('ts', 'datetime64[ns]'), ('open', 'f8'), ('high', 'f8'),
+                         ('low', 'f8'), ('close', 'f8'), ('volume', 'f8')])
+
+
+# JWT 헤더 (HS256 고정이므로 요청마다 직렬화하지 않음)
+_JWT_HEADER_SEGMENT = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b'=')
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+@lru_cache(maxsize=128)
+def _signed_query(items: Tuple) -> Tuple[str, str]:
+    """키 정렬된 파라미터 튜플의 (쿼리 스트링, query_hash(SHA512))
+
+    같은 파라미터로 반복 조회(티커 폴링 등)할 때 인코딩/해시를 다시 하지 않는다.
+    """
+    query_string = urlencode(items, doseq=True)
+    # pyupbit 방식: urlencode 후 배열 파라미터 처리
+    processed_query = query_string.replace("%5B%5D=", "[]=")
+    return processed_query, hashlib.sha512(processed_query.encode()).hexdigest()
+
 
 @dataclass
 class OrderResult:
@@ -37,41 +88,56 @@ class MarketData:
     market: str
     price: float
     volume: float
-    timestamp: datetime
+    timestamp: float  # epoch 초 (datetime은 dt로 필요할 때만 변환)
     high: float = 0
     low: float = 0
     open: float = 0
     prev_close: float = 0
 
+    @property
+    def dt(self) -> datetime:
+        return datetime.fromtimestamp(self.timestamp)
+
 
 class RateLimiter:
-    def __init__(self, max_calls: int = 600, time_window: int = 600):  # 10분에 600회
+    """토큰 버킷 레이트 리미터 (평균 time_window초당 max_calls회, 연속 호출은 burst회까지 허용)"""
+
+    def __init__(self, max_calls: int = 600, time_window: int = 600,  # 10분에 600회
+                 burst: Optional[int] = None):
         self.max_calls = max_calls
         self.time_window = time_window
-        self.calls = []
+        self.rate = max_calls / time_window  # 초당 충전되는 토큰
+        self.capacity = float(burst if burst is not None else max_calls)
+        self.tokens = self.capacity
+        # 시스템 시계 변경 영향이 없도록 monotonic 기준
+        self.last_refill = time.monotonic()
         self.lock = threading.Lock()
 
-    def can_call(self) -> bool:
-        with self.lock:
-            now = time.time()
-            # 시간 창 밖의 호출 기록 제거
-            self.calls = [
-                call_time for call_time in self.calls if now - call_time < self.time_window]
-            return len(self.calls) < self.max_calls
+    def acquire(self):
+        """토큰 하나를 잠금 안에서 차감하고, 부족하면 잠금 밖에서 충전될 때까지 대기
 
-    def add_call(self):
+        토큰이 음수로 내려가면 그만큼 미래 호출이 예약된 것이므로 뒤에 온 호출일수록 오래 기다린다.
+        확인과 차감을 한 번에 처리하므로 여러 스레드가 동시에 확인만 통과해 한도를 넘는 일이 없다.
+        """
         with self.lock:
-            self.calls.append(time.time())
-
-    def wait_if_needed(self):
-        if not self.can_call():
-            wait_time = self.time_window - (time.time() - self.calls[0])
-            if wait_time > 0:
-                time.sleep(wait_time + 1)
+            now = time.monotonic()
+            tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate) - 1
+            self.tokens = tokens
+            self.last_refill = now
+        if tokens < 0:
+            time.sleep(-tokens / self.rate)
 
 
 class UpbitAPI:
-    def __init__(self, access_key: str = None, secret_key: str = None):
+    # 같은 주기 안의 현재가/시장 데이터 조회가 티커 요청 하나를 공유하도록 짧게 캐시 (초)
+    TICKER_TTL = 1.0
+    # 잔고 조회(계좌 정보) 캐시 (초), 주문/취소 후에는 즉시 무효화
+    ACCOUNTS_TTL = 2.0
+    # 티커는 계정과 무관한 공개 시세이므로 프로세스 내 모든 UpbitAPI 인스턴스가 캐시를 공유
+    # (엔진/포지션 관리자/전략 모듈이 각자 인스턴스를 만들어도 같은 마켓은 TTL당 한 번만 조회)
+    _ticker_cache: Dict[str, Tuple[float, Dict]] = {}
+
+    def __init__(self, access_key: str = None, secret_key: str = None, prewarm: bool = False):
         # 로거 먼저 설정
         self.logger = self._setup_logger()
 
@@ -86,17 +152,54 @@ class UpbitAPI:
             self.secret_key and self.secret_key != 'your_secret_key_here')
 
         self.logger.info(
-            f"API 키 상태 - Access: {has_access_key}, Secret: {has_secret_key}")
+            "API 키 상태 - Access: %s, Secret: %s", has_access_key, has_secret_key)
 
         if not has_access_key or not has_secret_key:
             raise ValueError(
                 "Upbit API 키가 설정되지 않았습니다. 실거래를 위해서는 유효한 API 키가 필요합니다.")
 
+        # 비밀 키를 넣은 HMAC 상태를 한 번만 만들고 요청마다 복사해 서명
+        self._jwt_signer = hmac.new(self.secret_key.encode(), digestmod=hashlib.sha256)
+        # 요청마다 바뀌지 않는 페이로드 앞부분을 JSON 바이트로 미리 직렬화 (access_key 이스케이프 포함)
+        self._payload_prefix = (b'{"access_key":' + json.dumps(self.access_key).encode()
+                                + b',"nonce":"')
+
         self.base_url = "https://api.upbit.com"
+        # 엔드포인트별 전체 URL (요청마다 문자열을 새로 만들지 않음)
+        self._urls: Dict[str, str] = {}
         self.rate_limiter = RateLimiter()
+        self.session = self._create_session()
+        if prewarm:
+            self._prewarm_connection()
+        # (조회 시각, 계좌 목록, 통화별 계좌)
+        self._accounts_cache: Optional[Tuple[float, List[Dict], Dict[str, Dict]]] = None
 
         self.logger.info("Upbit API 초기화 완료 - 실거래 모드")
 
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """연결(TCP/TLS)을 재사용하는 HTTP 세션
+
+        일시적 오류(429/502/503)는 짧게 재시도한다. urllib3 기본값대로 POST(주문)는
+        중복 주문을 막기 위해 재시도하지 않는다.
+        """
+        session = requests.Session()
+        retry = Retry(total=2, backoff_factor=0.2, status_forcelist=(429, 502, 503),
+                      raise_on_status=False)
+        session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+        return session
+
+    def _prewarm_connection(self):
+        """공개 엔드포인트로 TCP/TLS 연결을 미리 맺어 첫 거래 요청의 핸드셰이크 지연 제거 (실패는 무시)"""
+        try:
+            self.session.head(self._url('/v1/market/all'), timeout=3)
+        except Exception as e:
+            self.logger.debug("연결 예열 실패: %s", e)
+
+    def close(self):
+        """HTTP 세션의 연결 풀 정리 (인스턴스를 교체하거나 더 이상 쓰지 않을 때)"""
+        self.session.close()
+
     def _setup_logger(self) -> logging.Logger:
         logger = logging.getLogger('UpbitAPI')
         logger.setLevel(logging.INFO)
@@ -107,28 +210,38 @@ class UpbitAPI:
                 '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
             )
             handler.setFormatter(formatter)
-            logger.addHandler(handler)
 
-        return logger
+            # 주문 스레드는 큐에 넣기만 하고 포맷/콘솔 출력은 백그라운드 리스너 스레드가 담당
+            log_queue = queue.SimpleQueue()
+            logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            listener = logging.handlers.QueueListener(log_queue, handler)
+            listener.start()
+            # 종료 시 큐에 남은 로그를 모두 기록
+            atexit.register(listener.stop)
 
-    def _get_headers(self, query_string: str = None) -> Dict[str, str]:
-        """JWT 토큰이 포함된 헤더 생성"""
-        payload = {
-            'access_key': self.access_key,
-            'nonce': str(uuid.uuid4()),
-        }
+        return logger
 
-        # 쿼리 스트링이 있고 비어있지 않을 때만 해시 추가
-        if query_string and query_string.strip():
-            m = hashlib.sha512()
-            # pyupbit 방식: urlencode 후 배열 파라미터 처리
-            processed_query = query_string.replace("%5B%5D=", "[]=")
-            m.update(processed_query.encode())
-            query_hash = m.hexdigest()
-            payload['query_hash'] = query_hash
-            payload['query_hash_alg'] = 'SHA512'
+    def _url(self, endpoint: str) -> str:
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = self.base_url + endpoint
+        return url
+
+    def _get_headers(self, query_hash: Optional[str] = None) -> Dict[str, str]:
+        """JWT 토큰이 포함된 헤더 생성 (query_hash는 쿼리 스트링이 있을 때만)"""
+        # nonce는 요청마다 달라야 하며 Upbit 문서 형식(UUID 문자열)을 유지
+        # nonce(UUID)와 query_hash(16진수)는 이스케이프가 필요 없으므로 바이트를 그대로 이어 붙임
+        payload = self._payload_prefix + str(uuid.uuid4()).encode()
+        if query_hash:
+            payload += b'","query_hash":"' + query_hash.encode() + b'","query_hash_alg":"SHA512"}'
+        else:
+            payload += b'"}'
 
-        jwt_token = jwt.encode(payload, self.secret_key, algorithm='HS256')
+        # HS256 JWT 서명 (표준 라이브러리 hmac/base64만 사용)
+        signing_input = _JWT_HEADER_SEGMENT + b'.' + _b64url(payload)
+        signer = self._jwt_signer.copy()
+        signer.update(signing_input)
+        jwt_token = (signing_input + b'.' + _b64url(signer.digest())).decode()
 
         return {
             'Authorization': f'Bearer {jwt_token}',
@@ -137,48 +250,45 @@ class UpbitAPI:
 
     def _make_request(self, method: str, endpoint: str, params: Dict = None) -> Optional[Dict]:
         """안전한 API 요청 실행 (GET/POST/DELETE 지원)"""
-        # 레이트 리미팅 확인
-        self.rate_limiter.wait_if_needed()
+        # 레이트 리미팅 (호출 슬롯 예약)
+        self.rate_limiter.acquire()
 
         try:
-            url = f"{self.base_url}{endpoint}"
+            url = self._url(endpoint)
             # Upbit는 query_hash 계산 시 파라미터를 키 알파벳순으로 정렬한 쿼리스트링을 사용
+            # GET/DELETE는 해시한 쿼리 스트링을 그대로 URL에 붙여 보내 해시와 전송 순서를 일치시킴
+            query_string = query_hash = None
             if params:
+                # 인증 조회는 대부분 키가 하나(uuid, markets 등)라 정렬 생략
+                items = tuple(params.items()) if len(params) == 1 else tuple(sorted(params.items()))
                 try:
-                    sorted_items = sorted(params.items(), key=lambda kv: kv[0])
-                    query_string = urlencode(sorted_items, doseq=True)
-                except Exception:
-                    query_string = urlencode(params)
-            else:
-                query_string = ""
-            headers = self._get_headers(query_string)
+                    query_string, query_hash = _signed_query(items)
+                except TypeError:
+                    # 리스트 값(uuids[] 등)은 캐시 키로 쓸 수 없으므로 매번 계산
+                    query_string, query_hash = _signed_query.__wrapped__(items)
+            headers = self._get_headers(query_hash)
             method_upper = method.upper()
+            query_url = f"{url}?{query_string}" if query_string else url
 
             if method_upper == 'GET':
-                response = requests.get(
-                    url, params=params, headers=headers, timeout=10)
+                response = self.session.get(query_url, headers=headers, timeout=10)
             elif method_upper == 'POST':
-                # 디버깅: POST 요청 로그
-                self.logger.info(f"POST 요청 URL: {url}")
-                self.logger.info(f"POST 요청 파라미터: {params}")
-                self.logger.info(f"POST 요청 헤더: {headers}")
+                # 디버깅: POST 요청 로그 (인증 토큰이 담긴 헤더는 남기지 않음)
+                self.logger.debug("POST 요청 URL: %s", url)
+                self.logger.debug("POST 요청 파라미터: %s", params)
 
                 # pyupbit 방식: JSON 데이터로 전송
-                import json
                 json_data = json.dumps(params)
-                response = requests.post(
+                response = self.session.post(
                     url, data=json_data, headers=headers, timeout=10)
             elif method_upper == 'DELETE':
-                response = requests.delete(
-                    url, params=params, headers=headers, timeout=10)
+                response = self.session.delete(query_url, headers=headers, timeout=10)
             else:
                 self.logger.error(f"지원하지 않는 HTTP 메서드: {method}")
                 return None
 
-            self.rate_limiter.add_call()
-
             if response.status_code == 200:
-                return response.json()
+                return _json_loads(response.content)
             else:
                 self.logger.error(
                     f"API 요청 실패: {response.status_code} - {response.text}")
@@ -189,8 +299,23 @@ class UpbitAPI:
             return None
 
     def get_accounts(self) -> Optional[List[Dict]]:
-        """계좌 정보 조회"""
-        return self._make_request('GET', '/v1/accounts')
+        """계좌 정보 조회 (ACCOUNTS_TTL 이내에 받은 응답이 있으면 재사용)"""
+        cached = self._get_accounts_cached()
+        return cached[1] if cached is not None else None
+
+    def _get_accounts_cached(self) -> Optional[Tuple[float, List[Dict], Dict[str, Dict]]]:
+        """계좌 캐시 항목 반환 (만료 시 재조회하며 통화별 색인도 함께 생성)"""
+        now = time.monotonic()
+        cached = self._accounts_cache
+        if cached is not None and now - cached[0] < self.ACCOUNTS_TTL:
+            return cached
+
+        accounts = self._make_request('GET', '/v1/accounts')
+        if accounts is None:
+            return None
+        cached = self._accounts_cache = (
+            now, accounts, {account['currency']: account for account in accounts})
+        return cached
 
     def get_candles(
         self,
@@ -199,55 +324,38 @@ class UpbitAPI:
         count: int = 200,
         timeframe: Optional[str] = None,
         interval: Optional[int] = None,
+        order: str = 'asc',
     ) -> Optional[List[Dict]]:
         """
         캔들 데이터 조회 (단일 API)
         - minutes가 지정되면 분/시간/일봉을 자동 매핑
         - timeframe/interval 조합도 지원 (예: timeframe='minutes', interval=60)
-        반환 데이터는 오래된 순으로 정렬됩니다.
+        반환 데이터는 오래된 순으로 정렬됩니다. order='desc'이면 Upbit 응답 그대로(최신 순) 반환합니다.
         """
-        try:
-            # 공개 캔들 API는 인증 불필요하므로 requests 직접 사용
-            if minutes is not None:
-                if minutes == 1440:
-                    url = "https://api.upbit.com/v1/candles/days"
-                else:
-                    url = f"https://api.upbit.com/v1/candles/minutes/{minutes}"
-                params = {'market': market, 'count': min(count, 200)}
-                resp = requests.get(url, params=params, timeout=10)
-                if resp.status_code == 200:
-                    candles = resp.json()
-                    candles.reverse()  # 오래된 → 최신
-                    return candles
-                self.logger.error(f"캔들 데이터 조회 실패: {resp.status_code}")
+        # 엔드포인트 결정 (minutes 우선, 다음 timeframe/interval, 기본 60분봉)
+        if minutes is not None:
+            endpoint = '/v1/candles/days' if minutes == 1440 else f'/v1/candles/minutes/{minutes}'
+        elif timeframe:
+            if timeframe == 'days' or (timeframe == 'minutes' and interval == 1440):
+                endpoint = '/v1/candles/days'
+            elif timeframe == 'weeks':
+                endpoint = '/v1/candles/weeks'
+            elif timeframe == 'minutes':
+                endpoint = f'/v1/candles/minutes/{interval or 60}'
+            else:
+                self.logger.error(f"지원하지 않는 시간프레임: {timeframe}")
                 return None
+        else:
+            endpoint = '/v1/candles/minutes/60'
 
-            # timeframe 기반
-            if timeframe:
-                if timeframe == 'days' or (timeframe == 'minutes' and interval == 1440):
-                    endpoint = '/v1/candles/days'
-                elif timeframe == 'weeks':
-                    endpoint = '/v1/candles/weeks'
-                elif timeframe == 'minutes':
-                    interval = interval or 60
-                    endpoint = f'/v1/candles/minutes/{interval}'
-                else:
-                    self.logger.error(f"지원하지 않는 시간프레임: {timeframe}")
-                    return None
-
-                params = {'market': market, 'count': min(count, 200)}
-                data = self._make_request('GET', endpoint, params)
-                if data is not None:
-                    data.reverse()  # 오래된 → 최신
-                return data
-
-            # 기본: 60분봉
-            url = f"https://api.upbit.com/v1/candles/minutes/60"
+        try:
+            # 공개 캔들 API는 인증 불필요하므로 JWT 없이 세션으로 직접 요청
             params = {'market': market, 'count': min(count, 200)}
-            resp = requests.get(url, params=params, timeout=10)
+            resp = self.session.get(self._url(endpoint), params=params, timeout=10)
             if resp.status_code == 200:
-                candles = resp.json()
-                candles.reverse()
+                candles = _json_loads(resp.content)
+                if order == 'asc':
+                    candles.reverse()  # 오래된 → 최신
                 return candles
             self.logger.error(f"캔들 데이터 조회 실패: {resp.status_code}")
             return None
@@ -256,46 +364,140 @@ class UpbitAPI:
             self.logger.error(f"캔들 데이터 조회 오류: {e}")
             return None
 
+    def get_candles_many(
+        self,
+        markets: List[str],
+        minutes: Optional[int] = None,
+        count: int = 200,
+        timeframe: Optional[str] = None,
+        interval: Optional[int] = None,
+        max_workers: int = 4,
+        order: str = 'asc',
+    ) -> Dict[str, Optional[List[Dict]]]:
+        """여러 마켓 캔들을 동시에 조회 (캔들 API는 마켓을 하나씩만 받으므로 세션 연결을 나눠 병렬 요청)"""
+        if not markets:
+            return {}
+
+        def fetch(market):
+            return self.get_candles(market, minutes=minutes, count=count,
+                                    timeframe=timeframe, interval=interval, order=order)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(markets))) as pool:
+            return dict(zip(markets, pool.map(fetch, markets)))
+
+    def get_candles_np(
+        self,
+        market: str = "KRW-BTC",
+        minutes: Optional[int] = None,
+        count: int = 200,
+        timeframe: Optional[str] = None,
+        interval: Optional[int] = None,
+    ) -> Optional[np.ndarray]:
+        """get_candles 결과를 CANDLE_DTYPE 구조화 배열 하나로 변환 (오래된 순, ts는 KST)"""
+        # 최신 순 응답을 뒤집지 않고 역순으로 순회하며 채움
+        candles = self.get_candles(market, minutes=minutes, count=count,
+                                   timeframe=timeframe, interval=interval, order='desc')
+        if candles is None:
+            return None
+        return np.fromiter(
+            ((c['candle_date_time_kst'], c['opening_price'], c['high_price'],
+              c['low_price'], c['trade_price'], c['candle_acc_trade_volume']) for c in reversed(candles)),
+            dtype=CANDLE_DTYPE, count=len(candles)
+        )
+
+    def _get_tickers(self, markets: List[str]) -> Dict[str, Dict]:
+        """여러 마켓 티커를 한 번에 조회 (TICKER_TTL 이내에 받은 응답은 재사용, 나머지만 한 요청으로 조회)"""
+        now = time.monotonic()
+        tickers = {}
+        missing = []
+        for market in markets:
+            cached = self._ticker_cache.get(market)
+            if cached is not None and now - cached[0] < self.TICKER_TTL:
+                tickers[market] = cached[1]
+            else:
+                missing.append(market)
+
+        if missing:
+            result = self._make_request('GET', '/v1/ticker', {'markets': ','.join(missing)})
+            for data in result or ():
+                self._ticker_cache[data['market']] = (now, data)
+                tickers[data['market']] = data
+        return tickers
+
+    def _get_ticker(self, market: str) -> Optional[Dict]:
+        """티커 조회"""
+        return self._get_tickers([market]).get(market)
+
+    @staticmethod
+    def _to_market_data(market: str, data: Dict) -> MarketData:
+        return MarketData(
+            market=market,
+            price=float(data['trade_price']),
+            volume=float(data['acc_trade_volume_24h']),
+            timestamp=time.time(),
+            high=float(data['high_price']),
+            low=float(data['low_price']),
+            open=float(data['opening_price']),
+            prev_close=float(data['prev_closing_price'])
+        )
+
     def get_current_price(self, market: str = "KRW-BTC") -> Optional[float]:
         """현재가 조회"""
-        result = self._make_request('GET', '/v1/ticker', {'markets': market})
-        if result and len(result) > 0:
-            return float(result[0]['trade_price'])
+        data = self._get_ticker(market)
+        if data:
+            return float(data['trade_price'])
         return None
 
+    def get_current_prices(self, markets: List[str]) -> Dict[str, float]:
+        """여러 마켓 현재가를 요청 한 번으로 조회 (조회 실패한 마켓은 제외)"""
+        return {market: float(data['trade_price'])
+                for market, data in self._get_tickers(markets).items()}
+
     def get_market_data(self, market: str = "KRW-BTC") -> Optional[MarketData]:
         """시장 데이터 조회"""
-        result = self._make_request('GET', '/v1/ticker', {'markets': market})
-        if result and len(result) > 0:
-            data = result[0]
-            return MarketData(
-                market=market,
-                price=float(data['trade_price']),
-                volume=float(data['acc_trade_volume_24h']),
-                timestamp=datetime.now(),
-                high=float(data['high_price']),
-                low=float(data['low_price']),
-                open=float(data['opening_price']),
-                prev_close=float(data['prev_closing_price'])
-            )
+        data = self._get_ticker(market)
+        if data:
+            return self._to_market_data(market, data)
         return None
 
+    def get_market_data_batch(self, markets: List[str]) -> Dict[str, MarketData]:
+        """여러 마켓 시장 데이터를 요청 한 번으로 조회 (조회 실패한 마켓은 제외)"""
+        return {market: self._to_market_data(market, data)
+                for market, data in self._get_tickers(markets).items()}
+
     def _round_tick(self, price: float) -> float:
         """업비트 틱사이즈 근사 반영 (간단 규칙)
         KRW-BTC 기준 대략 규칙 적용. 정확한 테이블은 업비트 정책 참조 필요.
         """
-        if price >= 2_000_000:
-            step = 1000
-        elif price >= 1_000_000:
-            step = 500
-        elif price >= 100_000:
-            step = 100
-        elif price >= 10_000:
-            step = 50
-        else:
-            step = 10
+        step = _TICK_STEPS[bisect_right(_TICK_BOUNDS, price)]
         return round(price / step) * step
 
+    @staticmethod
+    def round_tick_vec(prices: np.ndarray) -> np.ndarray:
+        """_round_tick의 배열 버전 (백테스트에서 여러 가격을 한 번에 보정)"""
+        prices = np.asarray(prices, dtype=np.float64)
+        steps = _TICK_STEP_ARRAY[np.searchsorted(_TICK_BOUNDS, prices, side='right')]
+        return np.round(prices / steps) * steps
+
+    @staticmethod
+    def ensure_min_order_vec(amounts: np.ndarray, volumes: np.ndarray, prices: np.ndarray,
+                             min_krw: float = 5000.0) -> Tuple[np.ndarray, np.ndarray]:
+        """_ensure_min_order의 배열 버전 (지정하지 않은 금액/수량은 NaN으로 전달)"""
+        amounts = np.asarray(amounts, dtype=np.float64)
+        volumes = np.asarray(volumes, dtype=np.float64)
+        prices = np.asarray(prices, dtype=np.float64)
+        amounts = np.where(np.isnan(amounts) & np.isnan(volumes), min_krw, amounts)
+        amounts = np.where(amounts < min_krw, min_krw, amounts)
+        volumes = np.where(np.isnan(volumes), amounts / np.maximum(prices, 1.0), volumes)
+        amounts = np.where(np.isnan(amounts), volumes * prices, amounts)
+        return amounts, volumes
+
+    @staticmethod
+    def _format_volume(volume: float) -> str:
+        """주문 수량을 소수점 8자리로 내림한 고정소수점 문자열 (지수 표기/보유량 초과 방지)"""
+        # numpy 스칼라는 repr이 'np.float64(...)'이므로 float로 바꾼 뒤 최단 10진 표현(str) 사용
+        return format(Decimal(str(float(volume))).quantize(_VOLUME_STEP, rounding=ROUND_DOWN), 'f')
+
     def _ensure_min_order(self, amount: Optional[float], volume: Optional[float], price: float) -> Tuple[float, float]:
         """최소 주문 금액/수량 충족 보정 (KRW 5000 기준)"""
         min_krw = 5000.0
@@ -326,11 +528,11 @@ class UpbitAPI:
                 if amount < min_krw:
                     amount = min_krw
 
-                self.logger.info(f"시장가 매수 주문: {market}, 금액: {amount}")
+                self.logger.info("시장가 매수 주문: %s, 금액: %s", market, amount)
                 result = upbit.buy_market_order(market, int(amount))
 
                 if result:
-                    self.logger.info(f"매수 주문 성공: {result.get('uuid')}")
+                    self.logger.info("매수 주문 성공: %s", result.get('uuid'))
                     return OrderResult(True, result.get('uuid'), "매수 주문 성공", result)
                 else:
                     return OrderResult(False, message="매수 주문 실패")
@@ -340,11 +542,11 @@ class UpbitAPI:
                 amount, volume = self._ensure_min_order(amount, volume, price)
 
                 self.logger.info(
-                    f"지정가 매수 주문: {market}, 가격: {price}, 수량: {volume}")
-                result = upbit.buy_limit_order(market, int(price), volume)
+                    "지정가 매수 주문: %s, 가격: %s, 수량: %s", market, price, volume)
+                result = upbit.buy_limit_order(market, int(price), self._format_volume(volume))
 
                 if result:
-                    self.logger.info(f"매수 주문 성공: {result.get('uuid')}")
+                    self.logger.info("매수 주문 성공: %s", result.get('uuid'))
                     return OrderResult(True, result.get('uuid'), "매수 주문 성공", result)
                 else:
                     return OrderResult(False, message="매수 주문 실패")
@@ -358,6 +560,9 @@ class UpbitAPI:
                 return OrderResult(False, message="최소 주문 금액(5,000원) 이상으로 주문해주세요.")
             else:
                 return OrderResult(False, message=f"매수 주문 오류: {error_msg}")
+        finally:
+            # 주문 결과와 무관하게 다음 잔고 조회는 새로 요청
+            self._accounts_cache = None
 
     def place_sell_order(self, market: str, price: float, volume: float) -> OrderResult:
         """매도 주문 (pyupbit 사용) - 시장가 매도"""
@@ -366,12 +571,12 @@ class UpbitAPI:
             import pyupbit
             upbit = pyupbit.Upbit(self.access_key, self.secret_key)
 
-            self.logger.info(f"시장가 매도 주문: {market}, 수량: {volume}")
+            self.logger.info("시장가 매도 주문: %s, 수량: %s", market, volume)
 
-            result = upbit.sell_market_order(market, volume)
+            result = upbit.sell_market_order(market, self._format_volume(volume))
 
             if result:
-                self.logger.info(f"매도 주문 성공: {result.get('uuid')}")
+                self.logger.info("매도 주문 성공: %s", result.get('uuid'))
                 return OrderResult(True, result.get('uuid'), "매도 주문 성공", result)
             else:
                 return OrderResult(False, message="매도 주문 실패")
@@ -379,16 +584,15 @@ class UpbitAPI:
         except Exception as e:
             self.logger.error(f"매도 주문 오류: {e}")
             return OrderResult(False, message=f"매도 주문 오류: {str(e)}")
+        finally:
+            self._accounts_cache = None
 
     def get_balance(self, currency: str = "KRW") -> float:
         """특정 통화 잔고 조회 (사용가능 + 주문중)"""
-        accounts = self.get_accounts()
-        if accounts:
-            for account in accounts:
-                if account['currency'] == currency:
-                    balance = float(account['balance'])
-                    locked = float(account['locked'])
-                    return balance + locked
+        cached = self._get_accounts_cached()
+        account = cached[2].get(currency) if cached is not None else None
+        if account:
+            return float(account['balance']) + float(account['locked'])
         return 0
 
     def get_order_status(self, order_id: str) -> Optional[Dict]:
@@ -396,10 +600,21 @@ class UpbitAPI:
         params = {'uuid': order_id}
         return self._make_request('GET', '/v1/order', params)
 
+    def get_orders_status(self, order_ids: List[str]) -> Dict[str, Dict]:
+        """여러 주문 상태를 uuid 목록 조회로 한 번에 확인 (요청당 최대 100개, 조회 실패분은 제외)"""
+        statuses = {}
+        for i in range(0, len(order_ids), 100):
+            params = {'uuids[]': order_ids[i:i + 100]}
+            orders = self._make_request('GET', '/v1/orders/uuids', params)
+            for order in orders or ():
+                statuses[order['uuid']] = order
+        return statuses
+
     def cancel_order(self, order_id: str) -> OrderResult:
         """주문 취소"""
         params = {'uuid': order_id}
         result = self._make_request('DELETE', '/v1/order', params)
+        self._accounts_cache = None
         if result:
             return OrderResult(True, message="주문 취소 성공", data=result)
         else:
@@ -0,0 +1,86 @@
+"""
+Upbit 실시간 시세 웹소켓 클라이언트
+- ticker 채널을 구독하여 체결가 업데이트를 콜백으로 전달
+- websocket-client 미설치 시 비활성화되며 기존 폴링 방식만 동작
+"""
+from __future__ import annotations
+import json
+import logging
+import threading
+import uuid
+from typing import Callable, List, Optional
+
+try:
+    import websocket
+    WEBSOCKET_AVAILABLE = True
+except ImportError:
+    WEBSOCKET_AVAILABLE = False
+
+
+UPBIT_WS_URL = "wss://api.upbit.com/websocket/v1"
+
+
+class UpbitTickerStream:
+    def __init__(self, markets: List[str], on_price: Callable[[str, float], None],
+                 reconnect_delay: float = 5.0):
+        self.markets = list(markets)
+        self.on_price = on_price
+        self.reconnect_delay = reconnect_delay
+        self.logger = logging.getLogger('UpbitTickerStream')
+        self._ws = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    def start(self) -> bool:
+        """수신 스레드 시작 (websocket-client 미설치 시 False)"""
+        if not WEBSOCKET_AVAILABLE:
+            self.logger.warning("websocket-client 미설치 - 실시간 시세 비활성화")
+            return False
+        if self._thread and self._thread.is_alive():
+            return True
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self.logger.info(f"실시간 시세 구독 시작: {self.markets}")
+        return True
+
+    def stop(self):
+        """수신 중지"""
+        self._stop_event.set()
+        if self._ws is not None:
+            try:
+                self._ws.close()
+            except Exception:
+                pass
+
+    def _run(self):
+        """연결이 끊기면 재접속하며 수신 유지"""
+        while not self._stop_event.is_set():
+            self._ws = websocket.WebSocketApp(
+                UPBIT_WS_URL,
+                on_open=self._on_open,
+                on_message=self._on_message,
+                on_error=self._on_error
+            )
+            self._ws.run_forever(ping_interval=60, ping_timeout=10)
+            if self._stop_event.wait(self.reconnect_delay):
+                break
+            self.logger.info("실시간 시세 재접속 시도")
+
+    def _on_open(self, ws):
+        request = [
+            {"ticket": str(uuid.uuid4())},
+            {"type": "ticker", "codes": self.markets, "isOnlyRealtime": True}
+        ]
+        ws.send(json.dumps(request))
+
+    def _on_message(self, ws, message):
+        try:
+            data = json.loads(message)
+            self.on_price(data['code'], float(data['trade_price']))
+        except Exception as e:
+            self.logger.error(f"실시간 시세 처리 오류: {e}")
+
+    def _on_error(self, ws, error):
+        self.logger.warning(f"실시간 시세 연결 오류: {error}")
@@ -64,8 +64,11 @@ def run_trading_engine():
     """트레이딩 엔진 실행"""
     try:
         print("🤖 트레이딩 엔진 시작 중...")
-        engine = TradingEngine()
-        engine.start()
+        engine = TradingEngine(prewarm=True)
+        try:
+            engine.start()
+        finally:
+            engine.close()
     except KeyboardInterrupt:
         print("\n⏹️  트레이딩 엔진 종료됨")
     except Exception as e:
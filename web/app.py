@@ -2307,7 +2307,7 @@ def api_manual_analyze():
                 market="KRW-BTC",
                 price=current_price or 95000000,  # 기본값 9500만원
                 volume=100.0,
-                timestamp=datetime.now(),
+                timestamp=datetime.now().timestamp(),
                 high=current_price * 1.02 if current_price else 96900000,
                 low=current_price * 0.98 if current_price else 93100000,
                 open=current_price * 0.999 if current_price else 94905000,
@@ -2319,7 +2319,7 @@ def api_manual_analyze():
                 market="KRW-BTC",
                 price=95000000,
                 volume=100.0,
-                timestamp=datetime.now(),
+                timestamp=datetime.now().timestamp(),
                 high=96900000,
                 low=93100000,
                 open=94905000,
@@ -2575,7 +2575,6 @@ def api_strategy_accuracy(strategy_id):
 def api_manual_execute():
     """수동 매매 실행 (락 체크 포함)"""
     try:
-        from core.trading_engine import TradingEngine
         from core.result_manager import result_manager
 
         data = request.json
@@ -2598,9 +2597,12 @@ def api_manual_execute():
                 'message': '거래 락을 획득할 수 없습니다. 다른 거래가 진행 중입니다.'
             }), 400
 
-        engine = TradingEngine()
-
         if action == 'analyze_and_execute':
+            # 자동 거래의 상주 엔진을 재사용 (요청마다 엔진을 만들면 워커 풀/설정 콜백이 쌓임)
+            engine = auto_trader.trading_engine
+            if engine is None:
+                raise RuntimeError("트레이딩 엔진을 로드할 수 없습니다")
+
             # 다층 전략 시스템 사용하여 분석 실행
             from core.multi_tier_strategy_engine import multi_tier_engine
 